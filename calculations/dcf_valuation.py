@@ -1,33 +1,170 @@
 # calculations/dcf_valuation.py
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba ist optional, ohne JIT läuft der Kernel als normales Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def _first_values(df, labels, default=0):
+    """
+    Liest für mehrere Zeilen den Wert der ersten Spalte (aktuellstes Jahr).
+
+    Die Zeilenpositionen werden einmal aus dem Index aufgebaut, danach erfolgt
+    der Zugriff positionsbasiert über iat statt über .loc[...].iloc[0].
+    """
+    positions = {}
+    for i, label in enumerate(df.index):
+        positions.setdefault(label, i)
+    return [df.iat[positions[label], 0] if label in positions else default for label in labels]
+
+
+# Mindestabstand zwischen Diskontsatz und ewiger Wachstumsrate (Gordon-Growth)
+MIN_RATE_SPREAD = 1e-6
+
+
+def _check_rates(discount_rate, perpetual_growth_rate):
+    """Der Terminal Value ist nur für discount_rate > perpetual_growth_rate definiert."""
+    if discount_rate - perpetual_growth_rate < MIN_RATE_SPREAD:
+        raise ValueError(
+            f"Diskontsatz ({discount_rate}) muss größer als die ewige Wachstumsrate ({perpetual_growth_rate}) sein"
+        )
+
+
+@njit(cache=True)
+def _dcf_core(fcf, cash, total_debt, shares_outstanding, forecast_years, discount_rate, growth_rate, perpetual_growth_rate):
+    """
+    Reine Float-Arithmetik des DCF-Modells.
+
+    Returns:
+        (enterprise_value, equity_value, intrinsic_value_per_share,
+         discounted_terminal_value, terminal_value, projected_cashflows,
+         discounted_cashflows)
+    """
+    # Wachstums- und Abzinsungsfaktor laufend multiplizieren statt pro Jahr zu potenzieren
+    projected = np.empty(forecast_years)
+    cashflows = np.empty(forecast_years)
+    growth_factor = 1.0
+    discount_factor = 1.0
+    for i in range(forecast_years):
+        growth_factor *= 1 + growth_rate
+        discount_factor *= 1 + discount_rate
+        projected[i] = fcf * growth_factor
+        cashflows[i] = projected[i] / discount_factor
+
+    final_fcf = fcf * growth_factor
+    terminal_value = (final_fcf * (1 + perpetual_growth_rate)) / (discount_rate - perpetual_growth_rate)
+    discounted_terminal_value = terminal_value / discount_factor
+
+    enterprise_value = cashflows.sum() + discounted_terminal_value
+    equity_value = enterprise_value - total_debt + cash
+    intrinsic_value_per_share = equity_value / shares_outstanding
+
+    return (enterprise_value, equity_value, intrinsic_value_per_share,
+            discounted_terminal_value, terminal_value, projected, cashflows)
+
+
+DCFResult = namedtuple('DCFResult', [
+    'enterprise_value', 'equity_value', 'intrinsic_value_per_share',
+    'projected_cashflows', 'cashflows', 'discounted_terminal_value'
+])
+
+
+@lru_cache(maxsize=1024)
+def _calc_cached(fcf, cash, total_debt, shares_outstanding, forecast_years, discount_rate, growth_rate, perpetual_growth_rate):
+    """
+    Memoisierter DCF auf den bereits extrahierten Kennzahlen.
+
+    Der DCF ist eine reine Funktion seiner Eingaben, daher liefern wiederholte
+    Aufrufe (z.B. bei jedem Dashboard-Redraw) das gespeicherte Ergebnis.
+    """
+    enterprise_value, equity_value, intrinsic_value_per_share, discounted_terminal_value, _, projected, cashflows = _dcf_core(
+        fcf, cash, total_debt, shares_outstanding,
+        forecast_years, discount_rate, growth_rate, perpetual_growth_rate
+    )
+    return DCFResult(float(enterprise_value), float(equity_value), float(intrinsic_value_per_share),
+                     tuple(projected.tolist()), tuple(cashflows.tolist()), float(discounted_terminal_value))
+
+
 class DCFValuation:
     @staticmethod
     def calculate_dcf(financial_data, ticker_symbol, forecast_years=5, discount_rate=0.0650, growth_rate=0.02, perpetual_growth_rate=0.02):
-        try:
-            fcf = financial_data['cashflow'].loc['Free Cash Flow'].iloc[0] if 'Free Cash Flow' in financial_data['cashflow'].index else 0
-            cash = financial_data['balance_sheet'].loc['Cash And Cash Equivalents'].iloc[0] if 'Cash And Cash Equivalents' in financial_data['balance_sheet'].index else 0
-            total_debt = financial_data['balance_sheet'].loc['Total Debt'].iloc[0] if 'Total Debt' in financial_data['balance_sheet'].index else 0
-            shares_outstanding = financial_data['Outstanding Shares']
-
-            cashflows = []
-            for i in range(forecast_years):
-                projected_fcf = fcf * (1 + growth_rate) ** (i + 1)
-                discounted_fcf = projected_fcf / (1 + discount_rate) ** (i + 1)
-                cashflows.append(discounted_fcf)
-
-            final_fcf = fcf * (1 + growth_rate) ** forecast_years
-            terminal_value = (final_fcf * (1 + perpetual_growth_rate)) / (discount_rate - perpetual_growth_rate)
-            discounted_terminal_value = terminal_value / (1 + discount_rate) ** forecast_years
-
-            enterprise_value = sum(cashflows) + discounted_terminal_value
-            equity_value = enterprise_value - total_debt + cash
-            intrinsic_value_per_share = equity_value / shares_outstanding
-
-            return {
-                'enterprise_value': enterprise_value,
-                'equity_value': equity_value,
-                'intrinsic_value_per_share': intrinsic_value_per_share,
-                'cashflows': cashflows,
-                'discounted_terminal_value': discounted_terminal_value
-            }
-        except Exception as e:
-            raise ValueError(f"Fehler beim DCF für {ticker_symbol}: {e}")
\ No newline at end of file
+        if not financial_data:
+            raise ValueError(f"Fehler beim DCF für {ticker_symbol}: keine Finanzdaten vorhanden")
+        cashflow = financial_data.get('cashflow')
+        balance_sheet = financial_data.get('balance_sheet')
+        shares_outstanding = financial_data.get('Outstanding Shares')
+
+        if cashflow is None or 'Free Cash Flow' not in cashflow.index or cashflow.shape[1] == 0:
+            raise ValueError(f"Fehler beim DCF für {ticker_symbol}: kein 'Free Cash Flow' im Cashflow")
+        if balance_sheet is None:
+            raise ValueError(f"Fehler beim DCF für {ticker_symbol}: keine Bilanz vorhanden")
+        if not shares_outstanding or shares_outstanding <= 0:
+            raise ValueError(f"Fehler beim DCF für {ticker_symbol}: ungültige Anzahl ausstehender Aktien")
+
+        _check_rates(discount_rate, perpetual_growth_rate)
+
+        fcf, = _first_values(cashflow, ['Free Cash Flow'])
+        cash, total_debt = _first_values(balance_sheet, ['Cash And Cash Equivalents', 'Total Debt'])
+
+        result = _calc_cached(
+            float(fcf), float(cash), float(total_debt), float(shares_outstanding),
+            int(forecast_years), float(discount_rate), float(growth_rate), float(perpetual_growth_rate)
+        )
+
+        return {
+            'enterprise_value': result.enterprise_value,
+            'equity_value': result.equity_value,
+            'intrinsic_value_per_share': result.intrinsic_value_per_share,
+            # Spaltenweise Arrays (Jahr, projizierter und abgezinster FCF)
+            'cashflows': {
+                'year': np.arange(1, int(forecast_years) + 1),
+                'projected_fcf': np.array(result.projected_cashflows),
+                'discounted_fcf': np.array(result.cashflows)
+            },
+            'discounted_terminal_value': result.discounted_terminal_value
+        }
+
+    @staticmethod
+    def calculate_dcf_batch(fcfs, cashes, debts, shares, forecast_years=5, discount_rate=0.0650, growth_rate=0.02, perpetual_growth_rate=0.02):
+        """
+        DCF für viele Ticker gleichzeitig (ein Element pro Ticker).
+
+        Alle Kennzahlen werden als 1-D Arrays übergeben und spaltenweise über
+        die Ticker-Achse berechnet.
+
+        Returns:
+            dict mit 1-D Arrays 'enterprise_value', 'equity_value',
+            'intrinsic_value_per_share' und 'discounted_terminal_value'
+        """
+        _check_rates(discount_rate, perpetual_growth_rate)
+
+        fcfs = np.asarray(fcfs, dtype=float)
+        cashes = np.asarray(cashes, dtype=float)
+        debts = np.asarray(debts, dtype=float)
+        shares = np.asarray(shares, dtype=float)
+
+        years = np.arange(1, forecast_years + 1)
+        growth_factors = (1 + growth_rate) ** years
+        discount_factors = (1 + discount_rate) ** years
+
+        discounted = fcfs[:, None] * (growth_factors / discount_factors)[None, :]
+        terminal_value = fcfs * growth_factors[-1] * (1 + perpetual_growth_rate) / (discount_rate - perpetual_growth_rate)
+        discounted_terminal_value = terminal_value / discount_factors[-1]
+
+        enterprise_value = discounted.sum(axis=1) + discounted_terminal_value
+        equity_value = enterprise_value - (debts - cashes)
+
+        return {
+            'enterprise_value': enterprise_value,
+            'equity_value': equity_value,
+            'intrinsic_value_per_share': equity_value / shares,
+            'discounted_terminal_value': discounted_terminal_value
+        }
@@ -6,11 +6,167 @@ Implements TSM following academic literature (Moskowitz, Ooi, Pedersen 2012):
 - Volatility-scaled position sizing
 - Configurable lookback and holding periods
 """
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Literal
 import pandas as pd
 import numpy as np
 
+try:
+    import bottleneck as bn
+except ImportError:  # bottleneck is optional; without it the rolling std runs in pandas
+    bn = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; without it the kernel runs as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Below this many scenarios, process start-up costs more than it saves: a
+# spawned worker pool takes ~1.5-2 s to start (each worker imports pandas and
+# numpy), one scenario takes ~2-3 ms on a few thousand daily bars. The
+# dashboard's handful of scenarios always runs serially; the pool is for
+# large parameter grids run through ScenarioComparison directly
+PARALLEL_MIN_SCENARIOS = 1000
+
+
+@njit(cache=True, nogil=True)
+def _signal_kernel(momentum, volatility, holding_days, long_short, vol_scaling, vol_target):
+    """
+    Raw signal, holding period and position size in one pass (before the 1-day shift).
+
+    long_cash: 1 when momentum > 0, else 0. long_short: sign of momentum,
+    NaN while momentum is undefined. A signal may only change every
+    holding_days bars; NaN bars keep NaN and do not count as a change.
+    """
+    n = len(momentum)
+    signal = np.empty(n)
+    position_size = np.empty(n)
+    last_change = 0
+    last_signal = 0.0
+
+    for i in range(n):
+        m = momentum[i]
+        if long_short:
+            if np.isnan(m):
+                raw = np.nan
+            elif m > 0:
+                raw = 1.0
+            elif m < 0:
+                raw = -1.0
+            else:
+                raw = 0.0
+        else:
+            raw = 1.0 if m > 0 else 0.0
+
+        if holding_days > 1 and not np.isnan(raw):
+            if i == 0 or (i - last_change) >= holding_days:
+                if raw != last_signal:
+                    last_change = i
+                    last_signal = raw
+            raw = last_signal
+        signal[i] = raw
+
+        if vol_scaling:
+            # Position size = target vol / realized vol, capped at 2x
+            size = vol_target / volatility[i]
+            if size > 2.0:
+                size = 2.0
+            position_size[i] = size * abs(raw)
+        else:
+            position_size[i] = abs(raw)
+
+    return signal, position_size
+
+
+@njit(cache=True, nogil=True)
+def _returns_stats_kernel(strategy_return, benchmark_return, drawdown):
+    """
+    Return and drawdown statistics in one pass over the returns frame.
+
+    Standard deviations are sample (ddof=1) via Welford updates and skip
+    NaN like pandas; fewer than two values give NaN. Returns
+    (n_strategy, strategy_std, n_downside, downside_std, benchmark_std,
+    max_drawdown, max_drawdown_duration).
+    """
+    n_strat = 0
+    mean_strat = 0.0
+    m2_strat = 0.0
+    n_down = 0
+    mean_down = 0.0
+    m2_down = 0.0
+    n_bench = 0
+    mean_bench = 0.0
+    m2_bench = 0.0
+    max_dd = np.nan
+    run = 0
+    max_run = 0
+
+    for i in range(len(strategy_return)):
+        r = strategy_return[i]
+        if not np.isnan(r):
+            n_strat += 1
+            delta = r - mean_strat
+            mean_strat += delta / n_strat
+            m2_strat += delta * (r - mean_strat)
+            if r < 0:
+                n_down += 1
+                delta = r - mean_down
+                mean_down += delta / n_down
+                m2_down += delta * (r - mean_down)
+
+        b = benchmark_return[i]
+        if not np.isnan(b):
+            n_bench += 1
+            delta = b - mean_bench
+            mean_bench += delta / n_bench
+            m2_bench += delta * (b - mean_bench)
+
+        dd = drawdown[i]
+        if not np.isnan(dd) and (np.isnan(max_dd) or dd < max_dd):
+            max_dd = dd
+        # Longest run of consecutive bars below the previous peak
+        if dd < 0:
+            run += 1
+            if run > max_run:
+                max_run = run
+        else:
+            run = 0
+
+    strat_std = np.sqrt(m2_strat / (n_strat - 1)) if n_strat > 1 else np.nan
+    down_std = np.sqrt(m2_down / (n_down - 1)) if n_down > 1 else np.nan
+    bench_std = np.sqrt(m2_bench / (n_bench - 1)) if n_bench > 1 else np.nan
+    return n_strat, strat_std, n_down, down_std, bench_std, max_dd, max_run
+
+
+@njit(cache=True, nogil=True)
+def _trade_stats_kernel(signal, returns):
+    """
+    Signal changes, winning days and days in a position in one pass.
+
+    A change needs two consecutive non-NaN signals; NaN signals count as
+    in a position (NaN != 0), matching the former pandas expressions.
+    """
+    num_trades = 0
+    winning_days = 0
+    position_days = 0
+
+    for i in range(len(signal)):
+        s = signal[i]
+        if i > 0 and s != signal[i - 1] and not np.isnan(s) and not np.isnan(signal[i - 1]):
+            num_trades += 1
+        if returns[i] * s > 0:
+            winning_days += 1
+        if s != 0:
+            position_days += 1
+
+    return num_trades, winning_days, position_days
+
 
 @dataclass
 class TSMParameters:
@@ -66,7 +222,8 @@ class TimeSeriesMomentum:
         self,
         prices: pd.Series,
         start_date: Optional[pd.Timestamp] = None,
-        end_date: Optional[pd.Timestamp] = None
+        end_date: Optional[pd.Timestamp] = None,
+        indicator_cache: Optional[dict] = None
     ) -> pd.DataFrame:
         """
         Generate TSM signals from price data.
@@ -75,6 +232,9 @@ class TimeSeriesMomentum:
             prices: pd.Series with DatetimeIndex containing closing prices
             start_date: Optional start date for signal generation
             end_date: Optional end date for signal generation
+            indicator_cache: Optional dict shared between calls on the same
+                (filtered) price series; daily returns, momentum and volatility
+                are computed once per lookback/window and reused
 
         Returns:
             pd.DataFrame with columns:
@@ -94,42 +254,53 @@ class TimeSeriesMomentum:
         if end_date is not None:
             prices = prices[prices.index <= end_date]
 
+        if indicator_cache is None:
+            indicator_cache = {}
+
         df = pd.DataFrame(index=prices.index)
         df['close'] = prices
 
         # Calculate daily returns
-        df['returns'] = df['close'].pct_change()
+        if 'returns' not in indicator_cache:
+            indicator_cache['returns'] = df['close'].pct_change()
+        df['returns'] = indicator_cache['returns']
 
         # Calculate momentum (lookback period returns)
         lookback_days = self.params.lookback_months * 21  # ~21 trading days per month
-        df['momentum'] = df['close'].pct_change(periods=lookback_days)
-
-        # Calculate rolling volatility (annualized)
-        df['volatility'] = df['returns'].rolling(
-            window=self.params.volatility_window
-        ).std() * np.sqrt(252)
-
-        # Set minimum volatility floor to avoid extreme position sizes
-        df['volatility'] = df['volatility'].clip(lower=0.05)
-
-        # Generate raw signals based on momentum sign
-        if self.params.position_type == 'long_cash':
-            # Long when momentum positive, cash otherwise
-            df['signal'] = np.where(df['momentum'] > 0, 1, 0)
-        else:
-            # Long when positive, short when negative
-            df['signal'] = np.sign(df['momentum'])
-
-        # Apply holding period (don't change signal within holding period)
-        df['signal'] = self._apply_holding_period(df['signal'])
-
-        # Calculate position size with volatility scaling
-        if self.params.enable_volatility_scaling:
-            # Position size = target vol / realized vol
-            df['position_size'] = (self.params.volatility_target / df['volatility']).clip(upper=2.0)
-            df['position_size'] = df['position_size'] * df['signal'].abs()
-        else:
-            df['position_size'] = df['signal'].abs().astype(float)
+        momentum_key = ('momentum', lookback_days)
+        if momentum_key not in indicator_cache:
+            indicator_cache[momentum_key] = df['close'].pct_change(periods=lookback_days)
+        df['momentum'] = indicator_cache[momentum_key]
+
+        # Calculate rolling volatility (annualized), with a minimum floor
+        # to avoid extreme position sizes
+        volatility_key = ('volatility', self.params.volatility_window)
+        if volatility_key not in indicator_cache:
+            window = self.params.volatility_window
+            if bn is not None and window <= len(df):
+                # Same semantics as rolling(window).std(): ddof=1, full window of valid values
+                rolling_std = pd.Series(
+                    bn.move_std(df['returns'].to_numpy(dtype=np.float64), window, min_count=window, ddof=1),
+                    index=df.index
+                )
+            else:
+                rolling_std = df['returns'].rolling(window=window).std()
+            indicator_cache[volatility_key] = (rolling_std * np.sqrt(252)).clip(lower=0.05)
+        df['volatility'] = indicator_cache[volatility_key]
+
+        # Generate signals based on momentum sign (long_cash: long or cash,
+        # long_short: long or short), hold them for the holding period and
+        # size positions with volatility scaling
+        signal, position_size = _signal_kernel(
+            df['momentum'].to_numpy(dtype=np.float64),
+            df['volatility'].to_numpy(dtype=np.float64),
+            int(self.params.holding_period_days),
+            self.params.position_type != 'long_cash',
+            bool(self.params.enable_volatility_scaling),
+            float(self.params.volatility_target)
+        )
+        df['signal'] = signal
+        df['position_size'] = position_size
 
         # Shift signals by 1 day to avoid look-ahead bias
         # (signal generated today, position entered tomorrow)
@@ -139,31 +310,6 @@ class TimeSeriesMomentum:
         self._signals = df
         return df
 
-    def _apply_holding_period(self, signals: pd.Series) -> pd.Series:
-        """
-        Apply holding period constraint to signals.
-        Only allow signal changes every N days.
-        """
-        if self.params.holding_period_days <= 1:
-            return signals
-
-        result = signals.copy()
-        last_change_idx = 0
-        last_signal = 0
-
-        for i, (idx, signal) in enumerate(signals.items()):
-            if pd.isna(signal):
-                continue
-
-            if i == 0 or (i - last_change_idx) >= self.params.holding_period_days:
-                if signal != last_signal:
-                    last_change_idx = i
-                    last_signal = signal
-
-            result.iloc[i] = last_signal
-
-        return result
-
     def calculate_strategy_returns(
         self,
         signals_df: Optional[pd.DataFrame] = None
@@ -188,28 +334,33 @@ class TimeSeriesMomentum:
         if signals_df is None:
             raise ValueError("No signals available. Call calculate_signals() first.")
 
-        df = pd.DataFrame(index=signals_df.index)
-
         # Daily returns from underlying
-        df['benchmark_return'] = signals_df['returns']
+        benchmark_return = signals_df['returns'].to_numpy(dtype=np.float64)
+        signal = signals_df['signal'].to_numpy(dtype=np.float64)
 
         # Strategy returns = signal * position_size * underlying return
         if self.params.enable_volatility_scaling:
-            df['strategy_return'] = (
-                signals_df['signal'] *
-                signals_df['position_size'] *
-                signals_df['returns']
-            )
+            strategy_return = signal * signals_df['position_size'].to_numpy(dtype=np.float64) * benchmark_return
         else:
-            df['strategy_return'] = signals_df['signal'] * signals_df['returns']
+            strategy_return = signal * benchmark_return
 
         # Cumulative returns (indexed to 100)
-        df['cumulative_strategy'] = (1 + df['strategy_return'].fillna(0)).cumprod() * 100
-        df['cumulative_benchmark'] = (1 + df['benchmark_return'].fillna(0)).cumprod() * 100
+        cumulative_strategy = np.cumprod(1 + np.where(np.isnan(strategy_return), 0.0, strategy_return)) * 100
+        cumulative_benchmark = np.cumprod(1 + np.where(np.isnan(benchmark_return), 0.0, benchmark_return)) * 100
 
         # Calculate drawdown
-        df['peak'] = df['cumulative_strategy'].cummax()
-        df['drawdown'] = (df['cumulative_strategy'] - df['peak']) / df['peak']
+        peak = np.maximum.accumulate(cumulative_strategy)
+
+        # Compounding runs in float64; the derived series are only plotted and
+        # summarized, so they are stored as float32 (half the memory per scenario)
+        df = pd.DataFrame({
+            'benchmark_return': benchmark_return,
+            'strategy_return': strategy_return.astype(np.float32),
+            'cumulative_strategy': cumulative_strategy.astype(np.float32),
+            'cumulative_benchmark': cumulative_benchmark.astype(np.float32),
+            'peak': peak.astype(np.float32),
+            'drawdown': ((cumulative_strategy - peak) / peak).astype(np.float32)
+        }, index=signals_df.index)
 
         self._returns = df
         return df
@@ -233,35 +384,34 @@ class TimeSeriesMomentum:
         if returns_df is None:
             raise ValueError("No returns available. Call calculate_strategy_returns() first.")
 
-        strategy_returns = returns_df['strategy_return'].dropna()
-        benchmark_returns = returns_df['benchmark_return'].dropna()
+        # Volatilities, max drawdown and its duration in one pass
+        n_strat, strat_std, n_down, down_std, bench_std, max_dd, dd_duration = _returns_stats_kernel(
+            returns_df['strategy_return'].to_numpy(dtype=np.float64),
+            returns_df['benchmark_return'].to_numpy(dtype=np.float64),
+            returns_df['drawdown'].to_numpy(dtype=np.float64)
+        )
+        max_dd = float(max_dd)
+        dd_duration = int(dd_duration)
 
         # Total and annualized returns
-        total_return = (returns_df['cumulative_strategy'].iloc[-1] / 100) - 1
-        num_years = len(strategy_returns) / 252
+        total_return = float(returns_df['cumulative_strategy'].iloc[-1]) / 100 - 1
+        num_years = n_strat / 252
         annualized_return = (1 + total_return) ** (1 / num_years) - 1 if num_years > 0 else 0
 
         # Benchmark metrics
-        benchmark_total = (returns_df['cumulative_benchmark'].iloc[-1] / 100) - 1
+        benchmark_total = float(returns_df['cumulative_benchmark'].iloc[-1]) / 100 - 1
 
         # Volatility
-        annualized_vol = strategy_returns.std() * np.sqrt(252)
-        benchmark_vol = benchmark_returns.std() * np.sqrt(252)
+        annualized_vol = strat_std * np.sqrt(252)
+        benchmark_vol = bench_std * np.sqrt(252)
 
         # Sharpe ratios
         sharpe = (annualized_return - self.params.risk_free_rate) / annualized_vol if annualized_vol > 0 else 0
         benchmark_ann_return = (1 + benchmark_total) ** (1 / num_years) - 1 if num_years > 0 else 0
         benchmark_sharpe = (benchmark_ann_return - self.params.risk_free_rate) / benchmark_vol if benchmark_vol > 0 else 0
 
-        # Max drawdown
-        max_dd = returns_df['drawdown'].min()
-
-        # Max drawdown duration
-        dd_duration = self._calculate_max_dd_duration(returns_df['drawdown'])
-
         # Sortino ratio (downside volatility)
-        downside_returns = strategy_returns[strategy_returns < 0]
-        downside_vol = downside_returns.std() * np.sqrt(252) if len(downside_returns) > 0 else 0.0001
+        downside_vol = down_std * np.sqrt(252) if n_down > 0 else 0.0001
         sortino = (annualized_return - self.params.risk_free_rate) / downside_vol
 
         # Calmar ratio
@@ -287,36 +437,20 @@ class TimeSeriesMomentum:
             excess_return=total_return - benchmark_total
         )
 
-    def _calculate_max_dd_duration(self, drawdown: pd.Series) -> int:
-        """Calculate the longest drawdown duration in days."""
-        in_drawdown = drawdown < 0
-
-        if not in_drawdown.any():
-            return 0
-
-        # Find consecutive drawdown periods
-        dd_groups = (~in_drawdown).cumsum()
-        dd_lengths = in_drawdown.groupby(dd_groups).sum()
-
-        return int(dd_lengths.max()) if len(dd_lengths) > 0 else 0
-
     def _calculate_trade_stats(self, signals_df: pd.DataFrame) -> dict:
         """Calculate trade-level statistics."""
         if signals_df is None:
             return {'win_rate': 0, 'num_trades': 0, 'avg_holding': 0}
 
-        # Detect signal changes (trades)
-        signal_changes = signals_df['signal'].diff().fillna(0) != 0
-        num_trades = signal_changes.sum()
+        # Signal changes (trades) and win rate based on returns during positions
+        num_trades, winning_days, total_position_days = _trade_stats_kernel(
+            signals_df['signal'].to_numpy(dtype=np.float64),
+            signals_df['returns'].to_numpy(dtype=np.float64)
+        )
 
         if num_trades == 0:
             return {'win_rate': 0, 'num_trades': 0, 'avg_holding': 0}
 
-        # Calculate win rate based on returns during positions
-        position_returns = signals_df['returns'] * signals_df['signal']
-        winning_days = (position_returns > 0).sum()
-        total_position_days = (signals_df['signal'] != 0).sum()
-
         win_rate = winning_days / total_position_days if total_position_days > 0 else 0
         avg_holding = total_position_days / num_trades if num_trades > 0 else 0
 
@@ -342,39 +476,70 @@ class TimeSeriesMomentum:
         if signals_df is None:
             return pd.DataFrame()
 
-        trades = []
-        current_position = 0
-        entry_date = None
-        entry_price = None
+        # Bars without a signal (warm-up) are skipped entirely
+        signal = signals_df['signal'].to_numpy(dtype=np.float64)
+        valid = ~np.isnan(signal)
+        signal = signal[valid]
+        dates = signals_df.index[valid]
+        closes = signals_df['close'].to_numpy(dtype=np.float64)[valid]
+
+        # Position changes against the previous bar (flat before the first bar)
+        previous = np.concatenate(([0.0], signal[:-1]))
+        changes = np.flatnonzero(signal != previous)
+
+        # Each change closes the position opened at the previous change,
+        # unless that position was flat; a still-open position is not logged
+        entries = changes[:-1]
+        exits = changes[1:]
+        opened = signal[entries] != 0
+        entries = entries[opened]
+        exits = exits[opened]
+
+        if len(entries) == 0:
+            return pd.DataFrame()
+
+        direction = signal[entries]
+        entry_dates = dates[entries]
+        exit_dates = dates[exits]
+        return pd.DataFrame({
+            'entry_date': entry_dates,
+            'exit_date': exit_dates,
+            'entry_price': closes[entries],
+            'exit_price': closes[exits],
+            'direction': np.where(direction > 0, 'Long', 'Short'),
+            'return': (closes[exits] / closes[entries] - 1) * direction,
+            'holding_days': (exit_dates - entry_dates).days
+        })
+
 
-        for date, row in signals_df.iterrows():
-            signal = row['signal']
+def _evaluate_scenario(
+    params: TSMParameters,
+    prices: pd.Series,
+    indicator_cache: dict
+) -> TSMPerformanceMetrics:
+    """Run one scenario end to end and return its metrics."""
+    tsm = TimeSeriesMomentum(params)
+    signals = tsm.calculate_signals(prices, indicator_cache=indicator_cache)
+    returns = tsm.calculate_strategy_returns(signals)
+    return tsm.calculate_performance_metrics(returns)
 
-            if pd.isna(signal):
-                continue
 
-            # Position change detected
-            if signal != current_position:
-                # Close existing position
-                if current_position != 0 and entry_date is not None:
-                    trades.append({
-                        'entry_date': entry_date,
-                        'exit_date': date,
-                        'entry_price': entry_price,
-                        'exit_price': row['close'],
-                        'direction': 'Long' if current_position > 0 else 'Short',
-                        'return': (row['close'] / entry_price - 1) * current_position,
-                        'holding_days': (date - entry_date).days
-                    })
+# Per-process state of the scenario workers, set once by the pool initializer
+_worker_prices: Optional[pd.Series] = None
+_worker_cache: dict = {}
 
-                # Open new position
-                if signal != 0:
-                    entry_date = date
-                    entry_price = row['close']
 
-                current_position = signal
+def _init_scenario_worker(prices: pd.Series) -> None:
+    """Receive the price series once per worker instead of once per task."""
+    global _worker_prices, _worker_cache
+    _worker_prices = prices
+    _worker_cache = {}
 
-        return pd.DataFrame(trades)
+
+def _run_scenario(item: tuple) -> TSMPerformanceMetrics:
+    """Worker entry point for ScenarioComparison.run_all."""
+    _, params = item
+    return _evaluate_scenario(params, _worker_prices, _worker_cache)
 
 
 @dataclass
@@ -398,13 +563,26 @@ class ScenarioComparison:
             pd.DataFrame with scenario names as index and metrics as columns
         """
         results_data = []
+        items = list(self.scenarios.items())
+
+        if len(items) >= PARALLEL_MIN_SCENARIOS:
+            # Scenarios are independent backtests on the same prices
+            max_workers = min(os.cpu_count() or 1, len(items))
+            # spawn instead of fork: the Dash server calling this is multi-threaded,
+            # and forking a threaded process can deadlock on locks held by other threads
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_scenario_worker,
+                initargs=(prices,)
+            ) as executor:
+                all_metrics = list(executor.map(_run_scenario, items))
+        else:
+            # All scenarios run on the same prices: share returns, momentum and volatility
+            indicator_cache = {}
+            all_metrics = [_evaluate_scenario(params, prices, indicator_cache) for _, params in items]
 
-        for name, params in self.scenarios.items():
-            tsm = TimeSeriesMomentum(params)
-            signals = tsm.calculate_signals(prices)
-            returns = tsm.calculate_strategy_returns(signals)
-            metrics = tsm.calculate_performance_metrics(returns)
-
+        for (name, params), metrics in zip(items, all_metrics):
             self.results[name] = metrics
 
             results_data.append({
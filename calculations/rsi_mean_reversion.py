@@ -22,6 +22,51 @@ import numpy as np
 from itertools import product
 from datetime import datetime
 
+try:
+    import bottleneck as bn
+except ImportError:  # bottleneck ist optional, ohne läuft das Rolling über NumPy/pandas
+    bn = None
+
+try:
+    from numba import njit
+except ImportError:  # numba ist optional, ohne JIT läuft der Kernel als normales Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Gleitender Durchschnitt über kumulierte Summen in O(N).
+
+    Die ersten window-1 Werte sind NaN (wie bei pandas rolling().mean()).
+    Erwartet eine Reihe ohne NaN.
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) < window:
+        return out
+    cs = np.cumsum(values, dtype=np.float64)
+    out[window - 1] = cs[window - 1] / window
+    out[window:] = (cs[window:] - cs[:-window]) / window
+    return out
+
+
+@njit(cache=True)
+def _wilder_smooth(values, period):
+    """
+    Wilder-Glättung: einfacher Durchschnitt der ersten `period` Werte,
+    danach avg[i] = (avg[i-1] * (period - 1) + values[i]) / period.
+    """
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n < period:
+        return out
+    out[period - 1] = values[:period].mean()
+    for i in range(period, n):
+        out[i] = (out[i - 1] * (period - 1) + values[i]) / period
+    return out
+
 
 @dataclass
 class RSIMeanReversionParameters:
@@ -85,25 +130,28 @@ class RSIMeanReversion:
         gain = delta.where(delta > 0, 0.0)
         loss = (-delta).where(delta < 0, 0.0)
 
-        avg_gain = gain.rolling(window=period, min_periods=period).mean()
-        avg_loss = loss.rolling(window=period, min_periods=period).mean()
-
-        # Exponential smoothing nach erstem Wert
-        for i in range(period, len(prices)):
-            avg_gain.iloc[i] = (avg_gain.iloc[i-1] * (period - 1) + gain.iloc[i]) / period
-            avg_loss.iloc[i] = (avg_loss.iloc[i-1] * (period - 1) + loss.iloc[i]) / period
+        # Exponential smoothing nach erstem Wert (Kernel statt iloc-Schleife)
+        avg_gain = pd.Series(_wilder_smooth(gain.to_numpy(dtype=float), period), index=prices.index)
+        avg_loss = pd.Series(_wilder_smooth(loss.to_numpy(dtype=float), period), index=prices.index)
 
         rs = avg_gain / avg_loss.replace(0, np.nan)
         rsi = 100 - (100 / (1 + rs))
 
         return rsi
 
-    def calculate_signals(self, prices: pd.Series) -> pd.DataFrame:
+    def calculate_signals(
+        self,
+        prices: pd.Series,
+        indicator_cache: Optional[Dict] = None
+    ) -> pd.DataFrame:
         """
         Generiert Trading-Signale.
 
         Args:
             prices: pd.Series mit DatetimeIndex und Schlusskursen
+            indicator_cache: Optionales Dict für RSI/MA/StdDev je Periode.
+                Muss zu genau dieser Preisreihe gehören; wird von
+                RSIParameterOptimizer über alle Kombinationen geteilt.
 
         Returns:
             pd.DataFrame mit Signalen und Indikatoren
@@ -111,40 +159,72 @@ class RSIMeanReversion:
         if prices.empty:
             raise ValueError("Price series cannot be empty")
 
-        df = pd.DataFrame(index=prices.index)
-        df['close'] = prices
-        df['returns'] = df['close'].pct_change()
+        # Alle Spalten erst als Arrays berechnen, dann ein DataFrame in einem Schritt
+        close = prices.to_numpy(dtype=float)
+        returns = prices.pct_change().to_numpy(dtype=float)
+
+        cache = indicator_cache if indicator_cache is not None else {}
 
         # RSI berechnen
-        df['rsi'] = self._calculate_rsi(df['close'], self.params.rsi_period)
+        rsi_key = ('rsi', self.params.rsi_period)
+        if rsi_key not in cache:
+            cache[rsi_key] = self._calculate_rsi(prices, self.params.rsi_period).to_numpy(dtype=float)
+        rsi = cache[rsi_key]
 
         # Moving Average und Standard Deviation
-        df['ma'] = df['close'].rolling(window=self.params.ma_period).mean()
-        df['std'] = df['close'].rolling(window=self.params.ma_period).std()
+        ma_key = ('ma', self.params.ma_period)
+        if ma_key not in cache:
+            window = self.params.ma_period
+            # bottleneck verlangt window <= len(close); längere Fenster ergeben über pandas nur NaN
+            if bn is not None and window <= len(close):
+                # min_count=window entspricht dem NaN-Verhalten von pandas rolling()
+                cache[ma_key] = (
+                    bn.move_mean(close, window, min_count=window),
+                    bn.move_std(close, window, min_count=window, ddof=1)
+                )
+            else:
+                rolling = prices.rolling(window=window)
+                if np.isnan(close).any():
+                    ma = rolling.mean().to_numpy(dtype=float)
+                else:
+                    ma = _rolling_mean(close, window)
+                cache[ma_key] = (ma, rolling.std().to_numpy(dtype=float))
+        ma, std = cache[ma_key]
 
         # Bollinger Bands
-        df['upper_band'] = df['ma'] + (self.params.std_dev_multiplier * df['std'])
-        df['lower_band'] = df['ma'] - (self.params.std_dev_multiplier * df['std'])
+        upper_band = ma + (self.params.std_dev_multiplier * std)
+        lower_band = ma - (self.params.std_dev_multiplier * std)
 
         # Preis-Deviation vom MA in Standardabweichungen
-        df['price_deviation'] = (df['close'] - df['ma']) / df['std']
+        with np.errstate(divide='ignore', invalid='ignore'):
+            price_deviation = (close - ma) / std
 
         # Entry Conditions
-        df['long_condition'] = (
-            (df['rsi'] < self.params.rsi_oversold) &
-            (df['close'] < df['lower_band'])
-        )
-        df['short_condition'] = (
-            (df['rsi'] > self.params.rsi_overbought) &
-            (df['close'] > df['upper_band'])
-        )
+        long_condition = (rsi < self.params.rsi_oversold) & (close < lower_band)
+        short_condition = (rsi > self.params.rsi_overbought) & (close > upper_band)
 
         # Signale generieren (ohne Position-Management - wird in Trades gemacht)
-        df['raw_signal'] = 0
-        if self.params.position_type in ['long_only', 'long_short']:
-            df.loc[df['long_condition'], 'raw_signal'] = 1
-        if self.params.position_type in ['short_only', 'long_short']:
-            df.loc[df['short_condition'], 'raw_signal'] = -1
+        allow_long = self.params.position_type in ['long_only', 'long_short']
+        allow_short = self.params.position_type in ['short_only', 'long_short']
+        # -1/0/1 passt in int8 (1 Byte statt 8 pro Zeile)
+        raw_signal = np.where(
+            short_condition & allow_short, -1,
+            np.where(long_condition & allow_long, 1, 0)
+        ).astype(np.int8)
+
+        df = pd.DataFrame({
+            'close': close,
+            'returns': returns,
+            'rsi': rsi,
+            'ma': ma,
+            'std': std,
+            'upper_band': upper_band,
+            'lower_band': lower_band,
+            'price_deviation': price_deviation,
+            'long_condition': long_condition,
+            'short_condition': short_condition,
+            'raw_signal': raw_signal,
+        }, index=prices.index)
 
         self._signals = df
         return df
@@ -248,24 +328,29 @@ class RSIMeanReversion:
         df = pd.DataFrame(index=signals_df.index)
         df['close'] = signals_df['close']
         df['benchmark_return'] = signals_df['returns']
-        df['strategy_return'] = 0.0
-
-        # Renditen aus Trades zuordnen
-        for _, trade in self._trades.iterrows():
-            mask = (df.index >= trade['entry_date']) & (df.index <= trade['exit_date'])
-            if mask.any():
-                # Tägliche Rendite während Trade
-                trade_days = mask.sum()
-                if trade_days > 0:
-                    daily_return = trade['return_pct'] / 100 / trade_days
-                    direction = 1 if trade['direction'] == 'Long' else -1
-                    df.loc[mask, 'strategy_return'] = signals_df.loc[mask, 'returns'] * direction
-
-        df['cumulative_strategy'] = (1 + df['strategy_return'].fillna(0)).cumprod() * 100
-        df['cumulative_benchmark'] = (1 + df['benchmark_return'].fillna(0)).cumprod() * 100
-
-        df['peak'] = df['cumulative_strategy'].cummax()
-        df['drawdown'] = (df['cumulative_strategy'] - df['peak']) / df['peak']
+        # Renditen aus Trades zuordnen: Position je Tag über Start/Ende-Differenzen
+        # statt einer Datumsmaske pro Trade
+        position = np.zeros(len(df) + 1)
+        if not self._trades.empty:
+            starts = df.index.searchsorted(self._trades['entry_date'], side='left')
+            ends = df.index.searchsorted(self._trades['exit_date'], side='right')
+            directions = np.where(self._trades['direction'].to_numpy() == 'Long', 1.0, -1.0)
+            np.add.at(position, starts, directions)
+            np.add.at(position, ends, -directions)
+        position = np.cumsum(position[:-1])
+
+        returns = signals_df['returns'].to_numpy(dtype=float)
+        df['strategy_return'] = np.where(position != 0, returns * position, 0.0)
+
+        # Strategie und Benchmark in einem gemeinsamen cumprod-Durchlauf
+        period_returns = df[['strategy_return', 'benchmark_return']].to_numpy(dtype=float)
+        cumulative = np.cumprod(1 + np.nan_to_num(period_returns, nan=0.0), axis=0) * 100
+        df['cumulative_strategy'] = cumulative[:, 0]
+        df['cumulative_benchmark'] = cumulative[:, 1]
+
+        peak = np.maximum.accumulate(cumulative[:, 0])
+        df['peak'] = peak
+        df['drawdown'] = (cumulative[:, 0] - peak) / peak
 
         self._returns = df
         return df
@@ -294,36 +379,38 @@ class RSIMeanReversion:
                 params=self.params
             )
 
-        # Returns
-        total_return = (self._returns['cumulative_strategy'].iloc[-1] / 100) - 1
-        benchmark_return = (self._returns['cumulative_benchmark'].iloc[-1] / 100) - 1
+        # Returns (Endwerte beider Kurven aus einer Zeile)
+        cumulative = self._returns[['cumulative_strategy', 'cumulative_benchmark']].to_numpy(dtype=float)
+        total_return, benchmark_return = cumulative[-1] / 100 - 1
 
         num_years = len(self._returns) / 252
         annualized_return = (1 + total_return) ** (1 / max(num_years, 0.01)) - 1
 
         # Volatility
-        strategy_returns = self._returns['strategy_return'].dropna()
-        annualized_vol = strategy_returns.std() * np.sqrt(252) if len(strategy_returns) > 0 else 0.0001
+        strategy_returns = self._returns['strategy_return'].to_numpy(dtype=float)
+        strategy_returns = strategy_returns[~np.isnan(strategy_returns)]
+        annualized_vol = strategy_returns.std(ddof=1) * np.sqrt(252) if len(strategy_returns) > 0 else 0.0001
 
         # Sharpe
         sharpe = (annualized_return - self.params.risk_free_rate) / annualized_vol if annualized_vol > 0 else 0
 
         # Max Drawdown
-        max_dd = self._returns['drawdown'].min()
+        max_dd = np.nanmin(self._returns['drawdown'].to_numpy(dtype=float))
 
-        # Trade Statistics
-        num_trades = len(self._trades)
-        winning_trades = self._trades[self._trades['return_pct'] > 0]
-        losing_trades = self._trades[self._trades['return_pct'] < 0]
+        # Trade Statistics (Gewinner/Verlierer als Masken auf einem Array)
+        trade_returns = self._trades['return_pct'].to_numpy(dtype=float)
+        num_trades = len(trade_returns)
+        wins = trade_returns > 0
+        losses = trade_returns < 0
 
-        win_rate = len(winning_trades) / num_trades if num_trades > 0 else 0
-        avg_trade_return = self._trades['return_pct'].mean() if num_trades > 0 else 0
+        win_rate = wins.sum() / num_trades if num_trades > 0 else 0
+        avg_trade_return = trade_returns.mean() if num_trades > 0 else 0
 
-        gross_profit = winning_trades['return_pct'].sum() if len(winning_trades) > 0 else 0
-        gross_loss = abs(losing_trades['return_pct'].sum()) if len(losing_trades) > 0 else 0.0001
+        gross_profit = trade_returns[wins].sum() if wins.any() else 0
+        gross_loss = abs(trade_returns[losses].sum()) if losses.any() else 0.0001
         profit_factor = gross_profit / gross_loss if gross_loss > 0 else gross_profit
 
-        avg_holding = self._trades['holding_days'].mean() if num_trades > 0 else 0
+        avg_holding = self._trades['holding_days'].to_numpy(dtype=float).mean() if num_trades > 0 else 0
 
         return RSIMeanReversionMetrics(
             total_return=total_return,
@@ -426,13 +513,16 @@ class RSIParameterOptimizer:
         total = len(param_grid)
         self.results = []
 
+        # RSI und Bänder hängen nur von ihrer Periode ab, nicht von TP/SL etc.
+        indicator_cache: Dict = {}
+
         if verbose:
             print(f"Starte Optimierung mit {total} Parameterkombinationen...")
 
         for i, params in enumerate(param_grid):
             try:
                 strategy = RSIMeanReversion(params)
-                signals = strategy.calculate_signals(prices)
+                signals = strategy.calculate_signals(prices, indicator_cache)
                 strategy.simulate_trades(signals)
                 strategy.calculate_returns(signals)
                 metrics = strategy.calculate_metrics()
@@ -1,6 +1,78 @@
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
 import yfinance as yf
 import pandas as pd
 
+# Obergrenze für parallele Ticker-Abrufe
+MAX_FETCH_WORKERS = 16
+
+# Lokaler Datei-Cache für Kurs- und Finanzdaten
+CACHE_DIR = Path.home() / '.cache' / 'stock_dashboard'
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def _downcast_prices(df):
+    """Wandelt float64-Spalten in float32 um (halbiert den Speicherbedarf)."""
+    float_cols = df.select_dtypes('float64').columns
+    return df.astype({col: 'float32' for col in float_cols})
+
+
+def _categorical_rows(statement):
+    """Setzt die Zeilenbeschriftungen eines Finanzberichts als CategoricalIndex."""
+    statement.index = pd.CategoricalIndex(statement.index)
+    return statement
+
+
+def _cache_is_fresh(path):
+    """True, wenn die Cache-Datei existiert und jünger als CACHE_TTL_SECONDS ist."""
+    try:
+        return time.time() - path.stat().st_mtime < CACHE_TTL_SECONDS
+    except OSError:
+        return False
+
+
+def _read_cached_history(path):
+    """Liest gecachte Kursdaten (Parquet), None wenn nicht vorhanden oder nicht lesbar."""
+    if not _cache_is_fresh(path):
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception:  # pyarrow fehlt oder Datei beschädigt
+        return None
+
+
+def _write_cached_history(path, df):
+    """Schreibt Kursdaten als Parquet; ohne pyarrow wird der Cache übersprungen."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(path, compression='zstd')
+    except Exception as e:
+        print(f"Cache für {path.name} nicht geschrieben: {e}")
+
+
+def _read_cached_financials(path):
+    """Liest gecachte Finanzdaten (Pickle), None wenn nicht vorhanden oder nicht lesbar."""
+    if not _cache_is_fresh(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _write_cached_financials(path, financial_dict):
+    """Schreibt das Finanzdaten-Dictionary als Pickle."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            pickle.dump(financial_dict, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        print(f"Cache für {path.name} nicht geschrieben: {e}")
+
 
 class GetClosingPrices:
     """
@@ -8,68 +80,150 @@ class GetClosingPrices:
     """
     def __init__(self, ticker_list, start_date, end_date):
         self.ticker_list = ticker_list
+        # Menge parallel zu ticker_list für O(1)-Mitgliedschaftstests
+        self.ticker_set = set(ticker_list)
         self.start_date = start_date
         self.end_date = end_date
         self.historical_data = {}
         self.financial_data = {}
+        # Wird nach jedem Abruf erhöht, damit abgeleitete Caches veralten
+        self.version = 0
+        # Stand je Ticker: nur neu abgerufene Ticker machen ihre Caches ungültig
+        self.ticker_versions = {}
+
+    def add_tickers(self, tickers):
+        """Hängt noch nicht vorhandene Ticker an ticker_list an und hält ticker_set synchron."""
+        for ticker in tickers:
+            if ticker not in self.ticker_set:
+                self.ticker_set.add(ticker)
+                self.ticker_list.append(ticker)
+
+    def fetch_historical_data(self, tickers=None, start=None, end=None):
+        """
+        Datenabruf für Kurs- und Finanzdaten.
+
+        Ohne Argumente werden alle Ticker über den Standardzeitraum geladen;
+        self.start_date/end_date werden dabei nie verändert.
+
+        Args:
+            tickers: Liste der Ticker-Symbole (Standard: self.ticker_list)
+            start, end: Zeitraum (Standard: self.start_date / self.end_date)
+        """
+        self.fetch_historical_data_parallel(
+            self.ticker_list if tickers is None else tickers,
+            self.start_date if start is None else start,
+            self.end_date if end is None else end
+        )
+
+    def fetch_historical_data_parallel(self, tickers, start_date, end_date):
+        """
+        Ruft Kurs- und Finanzdaten für die angegebenen Ticker parallel ab.
 
-    def fetch_historical_data(self):
-        """Datenabruf für Kursdaten gestartet"""
-        print(f"Starte Datenabruf für: {', '.join(self.ticker_list)} von {self.start_date} bis {self.end_date}")
-        for ticker_symbol in self.ticker_list:
-            print(f"Abrufen von Daten für {ticker_symbol}...")
-            try:
-                ticker_data = yf.Ticker(ticker_symbol)
-                ticker_df = ticker_data.history(start=self.start_date, end=self.end_date)
+        Args:
+            tickers: Liste der Ticker-Symbole
+            start_date, end_date: Zeitraum der Kursdaten (unabhängig von self.start_date/end_date)
+        """
+        print(f"Starte Datenabruf für: {', '.join(tickers)} von {start_date} bis {end_date}")
+        if not tickers:
+            return
 
-                if not ticker_df.empty:
+        # yfinance blockiert fast nur auf Netzwerk-I/O, daher reichen Threads
+        # Ein gemeinsames Tickers-Objekt statt eines neuen yf.Ticker pro Abruf
+        ticker_set = yf.Tickers(' '.join(tickers))
+        max_workers = min(MAX_FETCH_WORKERS, len(tickers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self._fetch_one, ticker_set.tickers[ticker_symbol.upper()], ticker_symbol,
+                                       start_date, end_date): ticker_symbol
+                       for ticker_symbol in tickers}
+            for future in as_completed(futures):
+                ticker_symbol = futures[future]
+                ticker_df, financial_dict = future.result()
+                if ticker_df is not None:
                     self.historical_data[ticker_symbol] = ticker_df
-                    print(f"Daten für {ticker_symbol} erfolgreich abgerufen.")
-                else:
-                    print(f"Warnung: Keine Daten für {ticker_symbol} im angegebenen Zeitraum gefunden.")
-            except Exception as e:
-                print(f"Fehler beim Abrufen von Daten für {ticker_symbol}: {e}")
-        print("Datenabruf für Kursdaten abgeschlossen.")
-
-        """Datenabruf für Finanzdaten"""
-        print(f"Starte Datenabruf für: {', '.join(self.ticker_list)}")
-        for ticker_symbol in self.ticker_list:
-                    print(f'Rufe Finanzdaten für Ticker {ticker_symbol} ab.')
-
-                    try:
-                        ticker_data = yf.Ticker(ticker_symbol)
-                        financials = ticker_data.financials      # Jährliche Gewinn- und Verlustrechnung
-                        cashflow = ticker_data.cashflow          # Jährliche Cashflow-Rechnung
-                        balance_sheet = ticker_data.balance_sheet # Jährliche Bilanz
-                        cash = balance_sheet.loc['Cash And Cash Equivalents'] if 'Cash And Cash Equivalents' in balance_sheet.index else 0
-                        shares_outstanding = ticker_data.info['sharesOutstanding']
-                        fcf = cashflow.loc['Free Cash Flow'].iloc[0] if 'Free Cash Flow' in cashflow.index else cashflow.loc['Operating Cash Flow'].iloc[-1]
-                        total_debt = balance_sheet.loc['Total Debt']
-                        
-                        
-                        print(f"Finanzdaten für {ticker_symbol} erfolgreich abgerufen.")     
-
-                    #Dataframes aus Finanzdaten für einen Stockticker zusammenführen als Dictionary
-                        self.financial_data[ticker_symbol] = {'financials': financials,
-                                                              'cashflow': cashflow,
-                                                              'balance_sheet': balance_sheet,
-                                                              #'Total Cash': cash,
-                                                              'Outstanding Shares': shares_outstanding,
-                                                              'Free Cashflow': fcf
-                                                              #'Total Debt': total_debt
-                                                              }
-                                                                    
-                        print(f"Finanzdataframe für {ticker_symbol} erfolgreich erstellt.")
-                        print('This is cash:', cash, shares_outstanding)
-                        
-                    except Exception as e:
-                        print(f"Fehler beim Abrufen von Finanzdaten für {ticker_symbol}: {e}")            
-        print('Finanzdatenabruf abgeschlossen.')   
+                if financial_dict is not None:
+                    self.financial_data[ticker_symbol] = financial_dict
+        self.version += 1
+        for ticker_symbol in tickers:
+            self.ticker_versions[ticker_symbol] = self.version
+        print('Datenabruf für Kurs- und Finanzdaten abgeschlossen.')
+
+    def _fetch_one(self, ticker_data, ticker_symbol, start_date, end_date):
+        """Ruft Kursdaten und Finanzdaten für einen Ticker ab (läuft im Worker-Thread)."""
+        return (self._fetch_history(ticker_data, ticker_symbol, start_date, end_date),
+                self._fetch_financials(ticker_data, ticker_symbol))
+
+    def _fetch_history(self, ticker_data, ticker_symbol, start_date, end_date):
+        """Kursdaten für einen Ticker, None bei Fehler oder leerem Ergebnis"""
+        cache_path = CACHE_DIR / f"{ticker_symbol}_{start_date}_{end_date}.parquet"
+        ticker_df = _read_cached_history(cache_path)
+        if ticker_df is not None:
+            print(f"Daten für {ticker_symbol} aus dem Cache geladen.")
+            return ticker_df
+
+        print(f"Abrufen von Daten für {ticker_symbol}...")
+        try:
+            ticker_df = ticker_data.history(start=start_date, end=end_date)
+
+            if not ticker_df.empty:
+                ticker_df = _downcast_prices(ticker_df)
+                print(f"Daten für {ticker_symbol} erfolgreich abgerufen.")
+                _write_cached_history(cache_path, ticker_df)
+                return ticker_df
+            print(f"Warnung: Keine Daten für {ticker_symbol} im angegebenen Zeitraum gefunden.")
+        except Exception as e:
+            print(f"Fehler beim Abrufen von Daten für {ticker_symbol}: {e}")
+        return None
+
+    def _fetch_financials(self, ticker_data, ticker_symbol):
+        """Finanzdaten für einen Ticker als Dictionary, None bei Fehler"""
+        cache_path = CACHE_DIR / f"{ticker_symbol}_financials.pkl"
+        financial_dict = _read_cached_financials(cache_path)
+        if financial_dict is not None:
+            print(f"Finanzdaten für {ticker_symbol} aus dem Cache geladen.")
+            return financial_dict
+
+        print(f'Rufe Finanzdaten für Ticker {ticker_symbol} ab.')
+
+        try:
+            financials = _categorical_rows(ticker_data.financials)      # Jährliche Gewinn- und Verlustrechnung
+            cashflow = _categorical_rows(ticker_data.cashflow)          # Jährliche Cashflow-Rechnung
+            balance_sheet = _categorical_rows(ticker_data.balance_sheet) # Jährliche Bilanz
+            cash = balance_sheet.loc['Cash And Cash Equivalents'] if 'Cash And Cash Equivalents' in balance_sheet.index else 0
+            info = ticker_data.get_info()            # nur ein info-Abruf pro Ticker
+            shares_outstanding = info['sharesOutstanding']
+            cf_idx = {label: i for i, label in enumerate(cashflow.index)}
+            fcf = cashflow.iat[cf_idx['Free Cash Flow'], 0] if 'Free Cash Flow' in cf_idx else cashflow.iat[cf_idx['Operating Cash Flow'], -1]
+            total_debt = balance_sheet.loc['Total Debt']
+
+            print(f"Finanzdaten für {ticker_symbol} erfolgreich abgerufen.")
+
+            #Dataframes aus Finanzdaten für einen Stockticker zusammenführen als Dictionary
+            financial_dict = {'financials': financials,
+                              'cashflow': cashflow,
+                              'balance_sheet': balance_sheet,
+                              #'Total Cash': cash,
+                              'Outstanding Shares': shares_outstanding,
+                              'Free Cashflow': fcf
+                              #'Total Debt': total_debt
+                              }
+
+            print(f"Finanzdataframe für {ticker_symbol} erfolgreich erstellt.")
+            print('This is cash:', cash, shares_outstanding)
+            _write_cached_financials(cache_path, financial_dict)
+            return financial_dict
+
+        except Exception as e:
+            print(f"Fehler beim Abrufen von Finanzdaten für {ticker_symbol}: {e}")
+        return None
 
     def get_data_for_ticker(self, ticker_symbol):
         """Ruft Chartdata für den gewählten Stockticker über den gewählten Zeitraum und Periode ab."""
         return self.historical_data.get(ticker_symbol)
     
+    def get_ticker_version(self, ticker_symbol):
+        """Datenstand eines Tickers (0, wenn er noch nie abgerufen wurde)."""
+        return self.ticker_versions.get(ticker_symbol, 0)
+
     def get_financial_data_for_ticker(self, ticker_symbol):
         "Ruft Finanzdaten wie Umsatz, Gewinn, Schulden etc. ab"
         return self.financial_data.get(ticker_symbol)
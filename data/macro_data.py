@@ -1,23 +1,123 @@
 # data/macro_data.py
 import yfinance as yf
-import pandas_datareader.data as web
+import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
 
+from .fetch_data import CACHE_DIR
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr ist optional, ohne läuft die Differenz über NumPy
+    ne = None
+
+# pandas_datareader wird erst beim ersten FRED-Abruf importiert
+_web = None
+
+VIX_CACHE_PATH = CACHE_DIR / 'vix.parquet'
+YIELD_CACHE_PATH = CACHE_DIR / 'fred_yields.parquet'
+
+
+def _read_cache(path):
+    """Liest eine gecachte Zeitreihe, None wenn nicht vorhanden oder nicht lesbar."""
+    try:
+        return pd.read_parquet(path) if path.exists() else None
+    except Exception:  # pyarrow fehlt oder Datei beschädigt
+        return None
+
+
+def _write_cache(path, df):
+    """Schreibt die Zeitreihe als Parquet; ohne pyarrow wird der Cache übersprungen."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(path, compression='zstd')
+    except Exception:
+        pass
+
+
+def _load_incremental(path, start_date, end_date, fetch):
+    """
+    Lädt eine Zeitreihe aus dem Parquet-Cache und holt nur die fehlenden Tage nach.
+
+    Deckt der Cache den Start ab, wird ab dem letzten gecachten Datum abgerufen;
+    sonst der gesamte Zeitraum. Der letzte Tag wird dabei erneut geladen, damit
+    ein während des Handelstags gespeicherter Zwischenwert überschrieben wird.
+
+    Args:
+        path: Pfad der Cache-Datei
+        start_date, end_date: Gewünschter Zeitraum
+        fetch: Funktion (start, end) -> DataFrame mit DatetimeIndex
+    """
+    start = pd.Timestamp(start_date)
+    end = pd.Timestamp(end_date)
+    cached = _read_cache(path)
+
+    if cached is not None and not cached.empty and cached.index.min() <= start:
+        fetch_start = cached.index.max()
+    else:
+        fetch_start = start
+
+    data = cached
+    if fetch_start <= end:
+        new = fetch(fetch_start, end)
+        if new is not None and not new.empty:
+            data = new if cached is None else pd.concat([cached, new])
+            data = data[~data.index.duplicated(keep='last')].sort_index()
+            _write_cache(path, data)
+
+    if data is None:
+        return pd.DataFrame()
+    return data.loc[start:end]
+
+
+def _datareader():
+    """Importiert pandas_datareader.data beim ersten Aufruf."""
+    global _web
+    if _web is None:
+        import pandas_datareader.data as web
+        _web = web
+    return _web
+
+
+def _spread(long_rate, short_rate):
+    """Zinsdifferenz long - short; mit numexpr ohne Zwischen-Array."""
+    if ne is not None:
+        return ne.evaluate('long_rate - short_rate')
+    return np.subtract(long_rate, short_rate)
+
+
+def _download_vix(start_date, end_date):
+    vix_df = yf.download('^VIX', start=start_date, end=end_date, progress=False)
+    if isinstance(vix_df.columns, pd.MultiIndex) and ('Close', '^VIX') in vix_df.columns:
+        return vix_df[('Close', '^VIX')].to_frame('Close')
+    elif 'Close' in vix_df.columns:
+        return vix_df[['Close']]
+    raise ValueError("Weder ('Close', '^VIX') noch 'Close' Spalte im VIX DataFrame gefunden.")
+
+
 def fetch_vix_data(start_date, end_date):
     try:
-        vix_df = yf.download('^VIX', start=start_date, end=end_date, progress=False)
-        if isinstance(vix_df.columns, pd.MultiIndex) and ('Close', '^VIX') in vix_df.columns:
-            return vix_df[('Close', '^VIX')].dropna()
-        elif 'Close' in vix_df.columns:
-            return vix_df['Close'].dropna()
-        raise ValueError("Weder ('Close', '^VIX') noch 'Close' Spalte im VIX DataFrame gefunden.")
+        vix_df = _load_incremental(VIX_CACHE_PATH, start_date, end_date, _download_vix)
+        if 'Close' not in vix_df.columns:
+            return pd.Series(dtype=float, name='Close')
+        close = vix_df['Close']
+        values = close.to_numpy(dtype=float)
+        valid = ~np.isnan(values)
+        return pd.Series(values[valid], index=close.index[valid], name='Close')
     except Exception as e:
         raise ValueError(f"Fehler beim Laden der VIX Daten: {e}")
 
 def fetch_yield_curve_data(start_date, end_date, api_key):
     try:
-        yield_data = web.DataReader(['DGS10', 'DGS2'], 'fred', start=start_date, end=end_date, api_key=api_key)
-        yield_data['Spread'] = yield_data['DGS10'] - yield_data['DGS2']
-        return yield_data.dropna()
+        yield_data = _load_incremental(
+            YIELD_CACHE_PATH, start_date, end_date,
+            lambda start, end: _datareader().DataReader(['DGS10', 'DGS2'], 'fred', start=start, end=end, api_key=api_key)
+        )
+        yield_data = yield_data.copy()
+        yield_data['Spread'] = _spread(yield_data['DGS10'].to_numpy(dtype=float),
+                                       yield_data['DGS2'].to_numpy(dtype=float))
+        # Eine Zeilenmaske über alle Spalten statt dropna()
+        valid = ~np.isnan(yield_data.to_numpy(dtype=float)).any(axis=1)
+        return yield_data[valid]
     except Exception as e:
-        raise ValueError(f"Fehler beim Laden der Renditen Daten von FRED: {e}")
\ No newline at end of file
+        raise ValueError(f"Fehler beim Laden der Renditen Daten von FRED: {e}")
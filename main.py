@@ -1,6 +1,10 @@
 # main.py
 import sys
 import os
+import atexit
+import logging
+import logging.handlers
+import queue
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
 from data.fetch_data import GetClosingPrices
@@ -11,8 +15,31 @@ from config.settings import INITIAL_TICKERS, START_DATE, END_DATE, DEBUG_MODE, H
 from portfolio import PortfolioManager, register_portfolio_callbacks
 
 
+def configure_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Leitet alle Log-Ausgaben über eine Queue an einen Hintergrund-Thread.
+
+    Die Callback-Threads legen Log-Records nur in die Queue; das eigentliche
+    Schreiben auf stderr übernimmt der QueueListener in seinem eigenen Thread.
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s [%(name)s] %(message)s'))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
 def main():
     """Hauptfunktion zum Starten des Dashboards."""
+    configure_logging()
+
     print("=" * 60)
     print("  STOCK DASHBOARD - Aktienanalyse & Portfolio Tracker")
     print("=" * 60)
@@ -86,6 +86,52 @@ class PortfolioCalculations:
             'holdings_data': holdings_data,
         }
 
+    def calculate_snapshot(
+        self,
+        portfolio: Portfolio,
+        prices: Dict[str, Optional[float]]
+    ) -> dict:
+        """
+        Fasst Positionen, Summen, Allokation und Tagesänderung für den
+        'portfolio-snapshot-store' zusammen.
+
+        Alle Werte stammen aus calculate_portfolio_summary, calculate_allocation
+        und calculate_daily_change, damit Karten, Tabelle und Charts dieselben
+        Zahlen zeigen. Das Ergebnis ist JSON-serialisierbar.
+        """
+        summary = self.calculate_portfolio_summary(portfolio, prices)
+        holdings_data = summary['holdings_data']
+        total_value = summary['total_value']
+        daily_change, daily_change_percent = self.calculate_daily_change(portfolio)
+
+        return {
+            'portfolio_id': portfolio.id,
+            'benchmark_ticker': portfolio.benchmark_ticker,
+            'holding_ids': [d['holding'].id for d in holdings_data],
+            'tickers': [d['holding'].ticker for d in holdings_data],
+            'qty': [d['holding'].quantity for d in holdings_data],
+            'buy_prices': [d['holding'].buy_price for d in holdings_data],
+            'prices': [
+                float(prices[d['holding'].ticker]) if d['price_available'] else None
+                for d in holdings_data
+            ],
+            'cost': [d['cost_basis'] for d in holdings_data],
+            'values': [d['current_value'] for d in holdings_data],
+            'weights': [
+                d['current_value'] / total_value if total_value > 0 else 0.0
+                for d in holdings_data
+            ],
+            'pnl': [d['pnl'] for d in holdings_data],
+            'pnl_percent': [d['pnl_percent'] for d in holdings_data],
+            'total': total_value,
+            'total_cost': summary['total_cost_basis'],
+            'total_pnl': summary['total_pnl'],
+            'total_pnl_percent': summary['total_pnl_percent'],
+            'allocation': self.calculate_allocation(portfolio, prices),
+            'daily_change': float(daily_change),
+            'daily_change_percent': float(daily_change_percent),
+        }
+
     def calculate_allocation(
         self,
         portfolio: Portfolio,
@@ -95,11 +141,7 @@ class PortfolioCalculations:
         ticker_values: Dict[str, float] = {}
 
         for holding in portfolio.holdings:
-            price = prices.get(holding.ticker)
-            if price is not None:
-                value = holding.quantity * price
-            else:
-                value = holding.cost_basis
+            value = self.calculate_holding_pnl(holding, prices.get(holding.ticker))['current_value']
 
             if holding.ticker in ticker_values:
                 ticker_values[holding.ticker] += value
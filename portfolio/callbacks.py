@@ -233,6 +233,19 @@ def register_portfolio_callbacks(app, portfolio_manager: PortfolioManager):
             style={'color': NEGATIVE_COLOR}
         ), no_update, no_update, no_update, no_update
 
+    # Callback 3b: Snapshot (Werte, Gewichte, P/L) einmal pro Änderung berechnen
+    @app.callback(
+        Output('portfolio-snapshot-store', 'data'),
+        Input('portfolio-dropdown', 'value'),
+        Input('portfolio-data-store', 'data'),
+    )
+    def update_portfolio_snapshot(portfolio_id, store_data):
+        portfolio = portfolio_manager.get_portfolio(portfolio_id) if portfolio_id else None
+        if not portfolio:
+            return None
+        prices = portfolio_manager.get_portfolio_prices(portfolio_id)
+        return calculations.calculate_snapshot(portfolio, prices)
+
     # Callback 4: Summary Cards aktualisieren
     @app.callback(
         Output('summary-total-value', 'children'),
@@ -246,14 +259,13 @@ def register_portfolio_callbacks(app, portfolio_manager: PortfolioManager):
         Output('summary-daily-change-percent', 'children'),
         Output('summary-daily-change-percent', 'style'),
         Output('summary-positions-count', 'children'),
-        Input('portfolio-dropdown', 'value'),
-        Input('portfolio-data-store', 'data'),
+        Input('portfolio-snapshot-store', 'data'),
     )
-    def update_summary_cards(portfolio_id, store_data):
+    def update_summary_cards(snapshot):
         default_style = {'fontSize': '1.5em', 'fontWeight': 'bold', 'color': '#d1d4dc'}
         small_style = {'fontSize': '0.9em'}
 
-        if not portfolio_id:
+        if not snapshot:
             return (
                 '$0.00', default_style,
                 '$0.00', default_style,
@@ -263,60 +275,61 @@ def register_portfolio_callbacks(app, portfolio_manager: PortfolioManager):
                 '0',
             )
 
-        portfolio = portfolio_manager.get_portfolio(portfolio_id)
-        if not portfolio:
-            return (
-                '$0.00', default_style,
-                '$0.00', default_style,
-                '0.00%', small_style,
-                '$0.00', default_style,
-                '0.00%', small_style,
-                '0',
-            )
+        total_value = snapshot['total']
+        total_pnl = snapshot['total_pnl']
+        total_pnl_percent = snapshot['total_pnl_percent']
+        daily_change = snapshot['daily_change']
+        daily_change_percent = snapshot['daily_change_percent']
 
-        prices = portfolio_manager.get_portfolio_prices(portfolio_id)
-        summary = calculations.calculate_portfolio_summary(portfolio, prices)
-        daily_change, daily_change_percent = calculations.calculate_daily_change(portfolio)
-
-        pnl_color = get_color_for_value(summary['total_pnl'])
+        pnl_color = get_color_for_value(total_pnl)
         daily_color = get_color_for_value(daily_change)
 
         return (
-            format_currency(summary['total_value']),
+            format_currency(total_value),
             default_style,
-            format_currency(summary['total_pnl']),
+            format_currency(total_pnl),
             {**default_style, 'color': pnl_color},
-            format_percent(summary['total_pnl_percent']),
+            format_percent(total_pnl_percent),
             {**small_style, 'color': pnl_color},
             format_currency(daily_change),
             {**default_style, 'color': daily_color},
             format_percent(daily_change_percent),
             {**small_style, 'color': daily_color},
-            str(summary['holdings_count']),
+            str(len(snapshot['tickers'])),
         )
 
     # Callback 5: Holdings-Tabelle aktualisieren
     @app.callback(
         Output('holdings-table-container', 'children'),
-        Input('portfolio-dropdown', 'value'),
-        Input('portfolio-data-store', 'data'),
+        Input('portfolio-snapshot-store', 'data'),
     )
-    def update_holdings_table(portfolio_id, store_data):
-        if not portfolio_id:
+    def update_holdings_table(snapshot):
+        if not snapshot:
             return html.P(
                 'Bitte wählen Sie ein Portfolio.',
                 style={'color': NEUTRAL_COLOR, 'textAlign': 'center', 'padding': '20px'}
             )
 
-        portfolio = portfolio_manager.get_portfolio(portfolio_id)
-        if not portfolio or not portfolio.holdings:
+        if not snapshot['tickers']:
             return html.P(
                 'Keine Positionen vorhanden. Fügen Sie eine Position hinzu.',
                 style={'color': NEUTRAL_COLOR, 'textAlign': 'center', 'padding': '20px'}
             )
 
-        prices = portfolio_manager.get_portfolio_prices(portfolio_id)
-        performance = calculations.calculate_position_performance(portfolio, prices)
+        performance = [
+            {
+                'holding_id': snapshot['holding_ids'][i],
+                'ticker': snapshot['tickers'][i],
+                'quantity': snapshot['qty'][i],
+                'buy_price': snapshot['buy_prices'][i],
+                'current_price': snapshot['prices'][i],
+                'cost_basis': snapshot['cost'][i],
+                'current_value': snapshot['values'][i],
+                'pnl': snapshot['pnl'][i],
+                'pnl_percent': snapshot['pnl_percent'][i],
+            }
+            for i in range(len(snapshot['tickers']))
+        ]
 
         header_style = {
             'backgroundColor': '#131722',
@@ -406,13 +419,12 @@ def register_portfolio_callbacks(app, portfolio_manager: PortfolioManager):
     # Callback 6: Allokations-Pie-Chart
     @app.callback(
         Output('allocation-pie-chart', 'figure'),
-        Input('portfolio-dropdown', 'value'),
-        Input('portfolio-data-store', 'data'),
+        Input('portfolio-snapshot-store', 'data'),
     )
-    def update_allocation_chart(portfolio_id, store_data):
+    def update_allocation_chart(snapshot):
         fig = go.Figure()
 
-        if not portfolio_id:
+        if not snapshot:
             fig.update_layout(**get_chart_layout())
             fig.add_annotation(
                 text='Kein Portfolio ausgewählt',
@@ -422,8 +434,7 @@ def register_portfolio_callbacks(app, portfolio_manager: PortfolioManager):
             )
             return fig
 
-        portfolio = portfolio_manager.get_portfolio(portfolio_id)
-        if not portfolio or not portfolio.holdings:
+        if not snapshot['tickers']:
             fig.update_layout(**get_chart_layout())
             fig.add_annotation(
                 text='Keine Positionen',
@@ -433,8 +444,7 @@ def register_portfolio_callbacks(app, portfolio_manager: PortfolioManager):
             )
             return fig
 
-        prices = portfolio_manager.get_portfolio_prices(portfolio_id)
-        allocations = calculations.calculate_allocation(portfolio, prices)
+        allocations = snapshot['allocation']
 
         fig = go.Figure(data=[go.Pie(
             labels=[a['ticker'] for a in allocations],
@@ -560,24 +570,19 @@ def register_portfolio_callbacks(app, portfolio_manager: PortfolioManager):
     # Callback 9: Position-Performance-Bar-Chart
     @app.callback(
         Output('position-performance-chart', 'figure'),
-        Input('portfolio-dropdown', 'value'),
-        Input('portfolio-data-store', 'data'),
+        Input('portfolio-snapshot-store', 'data'),
     )
-    def update_position_performance_chart(portfolio_id, store_data):
+    def update_position_performance_chart(snapshot):
         fig = go.Figure()
 
-        if not portfolio_id:
+        if not snapshot or not snapshot['tickers']:
             fig.update_layout(**get_chart_layout())
             return fig
 
-        portfolio = portfolio_manager.get_portfolio(portfolio_id)
-        if not portfolio or not portfolio.holdings:
-            fig.update_layout(**get_chart_layout())
-            return fig
-
-        prices = portfolio_manager.get_portfolio_prices(portfolio_id)
-        performance = calculations.calculate_position_performance(portfolio, prices)
-
+        performance = [
+            {'ticker': ticker, 'pnl_percent': pnl_percent}
+            for ticker, pnl_percent in zip(snapshot['tickers'], snapshot['pnl_percent'])
+        ]
         performance.sort(key=lambda x: x['pnl_percent'], reverse=True)
 
         colors = [POSITIVE_COLOR if p['pnl_percent'] >= 0 else NEGATIVE_COLOR for p in performance]
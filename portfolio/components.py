@@ -62,6 +62,26 @@ INPUT_STYLE = {
 }
 
 
+# =============================================================================
+# Dropdown Optionen
+# =============================================================================
+
+BENCHMARK_OPTIONS = [
+    {'label': 'S&P 500 (^GSPC)', 'value': '^GSPC'},
+    {'label': 'NASDAQ 100 (^NDX)', 'value': '^NDX'},
+    {'label': 'DAX (^GDAXI)', 'value': '^GDAXI'},
+    {'label': 'Dow Jones (^DJI)', 'value': '^DJI'},
+]
+
+PERIOD_OPTIONS = [
+    {'label': '1 Monat', 'value': '1mo'},
+    {'label': '3 Monate', 'value': '3mo'},
+    {'label': '6 Monate', 'value': '6mo'},
+    {'label': '1 Jahr', 'value': '1y'},
+    {'label': '2 Jahre', 'value': '2y'},
+]
+
+
 def create_portfolio_header():
     """Erstellt den Header mit Portfolio-Auswahl und Buttons."""
     return html.Div([
@@ -121,12 +141,7 @@ def create_portfolio_header():
                     html.Label('Benchmark', style={'color': '#787b86', 'marginBottom': '5px'}),
                     dcc.Dropdown(
                         id='new-portfolio-benchmark',
-                        options=[
-                            {'label': 'S&P 500 (^GSPC)', 'value': '^GSPC'},
-                            {'label': 'NASDAQ 100 (^NDX)', 'value': '^NDX'},
-                            {'label': 'DAX (^GDAXI)', 'value': '^GDAXI'},
-                            {'label': 'Dow Jones (^DJI)', 'value': '^DJI'},
-                        ],
+                        options=BENCHMARK_OPTIONS,
                         value='^GSPC',
                         style={'marginBottom': '20px'},
                     ),
@@ -309,13 +324,7 @@ def create_charts_section():
                 html.H3('Portfolio-Wert', style={'color': '#d1d4dc', 'marginBottom': '10px'}),
                 dcc.Dropdown(
                     id='portfolio-value-period',
-                    options=[
-                        {'label': '1 Monat', 'value': '1mo'},
-                        {'label': '3 Monate', 'value': '3mo'},
-                        {'label': '6 Monate', 'value': '6mo'},
-                        {'label': '1 Jahr', 'value': '1y'},
-                        {'label': '2 Jahre', 'value': '2y'},
-                    ],
+                    options=PERIOD_OPTIONS,
                     value='1y',
                     style={'width': '150px', 'marginBottom': '10px'},
                     clearable=False,
@@ -360,6 +369,7 @@ def create_portfolio_layout():
         ),
 
         dcc.Store(id='portfolio-data-store'),
+        dcc.Store(id='portfolio-snapshot-store'),
 
         create_portfolio_header(),
         create_summary_cards(),
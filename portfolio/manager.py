@@ -5,12 +5,25 @@ Portfolio Manager - CRUD-Operationen und Preisdaten-Integration.
 
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
+import logging
+import re
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yfinance as yf
 import pandas as pd
 
 from .models import Holding, Portfolio
 from .storage import PortfolioStorage
 
+logger = logging.getLogger(__name__)
+
+# Gültige Ticker-Symbole (z.B. 'AAPL', 'BRK.B', '^GSPC', 'EURUSD=X', 'SAP.DE')
+_TICKER_RE = re.compile(r'^[A-Z0-9.\-^=]{1,12}$')
+
+# Yahoo Chart-Endpunkt: liefert den aktuellen Kurs in ~1KB statt des kompletten info-Dicts
+_CHART_URL = 'https://query1.finance.yahoo.com/v8/finance/chart/{ticker}'
+
 
 class PortfolioManager:
     """
@@ -28,6 +41,8 @@ class PortfolioManager:
         self.storage = PortfolioStorage(storage_dir)
         self.price_cache: Dict[str, dict] = {}
         self.cache_ttl = cache_ttl
+        self._bad_tickers: Dict[str, datetime] = {}
+        self._session = self._create_session()
         self._portfolios: Dict[str, Portfolio] = {}
         self._load_all_portfolios()
 
@@ -86,8 +101,12 @@ class PortfolioManager:
         if not portfolio:
             return None
 
+        ticker = ticker.upper().strip()
+        if not _TICKER_RE.match(ticker):
+            return None
+
         holding = Holding(
-            ticker=ticker.upper(),
+            ticker=ticker,
             quantity=quantity,
             buy_price=buy_price,
             buy_date=buy_date
@@ -119,31 +138,98 @@ class PortfolioManager:
         age = (datetime.now() - cache_entry['timestamp']).total_seconds()
         return age < self.cache_ttl
 
+    def _is_bad_ticker(self, ticker: str) -> bool:
+        """Prüft, ob ein Ticker ungültig ist oder kürzlich keinen Preis geliefert hat."""
+        if not _TICKER_RE.match(ticker):
+            return True
+        failed_at = self._bad_tickers.get(ticker)
+        if failed_at is None:
+            return False
+        if (datetime.now() - failed_at).total_seconds() < self.cache_ttl:
+            return True
+        del self._bad_tickers[ticker]
+        return False
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Erstellt eine HTTP-Session mit Connection-Pooling und Retries."""
+        session = requests.Session()
+        session.headers['User-Agent'] = 'Mozilla/5.0'
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.2),
+        )
+        session.mount('https://', adapter)
+        return session
+
+    def _fetch_quote(self, ticker: str) -> Optional[float]:
+        """
+        Holt den aktuellen Kurs direkt über den Yahoo Chart-Endpunkt.
+
+        Returns:
+            Kurs oder None, wenn Yahoo für den Ticker keinen Kurs kennt
+
+        Raises:
+            requests.RequestException: bei Netzwerkfehlern, Timeouts und
+                Serverfehlern (vorübergehend, kein Hinweis auf einen ungültigen Ticker)
+        """
+        response = self._session.get(
+            _CHART_URL.format(ticker=ticker),
+            params={'range': '1d', 'interval': '1d'},
+            timeout=5,
+        )
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        try:
+            meta = response.json()['chart']['result'][0]['meta']
+            price = meta.get('regularMarketPrice')
+            return float(price) if price is not None else None
+        except (ValueError, KeyError, IndexError, TypeError):
+            return None
+
     def get_current_price(self, ticker: str) -> Optional[float]:
         """Holt den aktuellen Preis für einen Ticker."""
         if self._is_cache_valid(ticker):
             return self.price_cache[ticker]['price']
 
-        try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            price = info.get('currentPrice') or info.get('regularMarketPrice')
-
-            if price is None:
-                hist = stock.history(period='1d')
-                if not hist.empty:
-                    price = hist['Close'].iloc[-1]
-
-            if price is not None:
-                self.price_cache[ticker] = {
-                    'price': float(price),
-                    'timestamp': datetime.now()
-                }
-                return float(price)
-
-        except Exception as e:
-            print(f"Fehler beim Abrufen des Preises für {ticker}: {e}")
+        if self._is_bad_ticker(ticker):
+            return None
 
+        # Vorübergehende Fehler (Netzwerk, Timeout) werden nur protokolliert;
+        # als ungültig gilt ein Ticker erst, wenn der Abruf gelang, aber keinen Kurs lieferte
+        transient_error = False
+        price = None
+        try:
+            price = self._fetch_quote(ticker)
+        except requests.RequestException as e:
+            transient_error = True
+            logger.warning("Fehler beim Abrufen des Kurses für %s", ticker, exc_info=e)
+
+        if price is None:
+            try:
+                stock = yf.Ticker(ticker)
+                info = stock.info
+                price = info.get('currentPrice') or info.get('regularMarketPrice')
+
+                if price is None:
+                    hist = stock.history(period='1d')
+                    if not hist.empty:
+                        price = hist['Close'].iloc[-1]
+            except Exception as e:
+                transient_error = True
+                logger.warning("Fehler beim Abrufen des Preises für %s", ticker, exc_info=e)
+
+        if price is not None:
+            self.price_cache[ticker] = {
+                'price': float(price),
+                'timestamp': datetime.now()
+            }
+            return float(price)
+
+        if not transient_error:
+            self._bad_tickers[ticker] = datetime.now()
         return None
 
     def get_historical_prices(
@@ -162,7 +248,7 @@ class PortfolioManager:
                 df = stock.history(period=period)
             return df if not df.empty else None
         except Exception as e:
-            print(f"Fehler beim Abrufen historischer Daten für {ticker}: {e}")
+            logger.warning("Fehler beim Abrufen historischer Daten für %s", ticker, exc_info=e)
             return None
 
     def get_portfolio_prices(self, portfolio_id: str) -> Dict[str, Optional[float]]:
@@ -188,4 +274,5 @@ class PortfolioManager:
             for ticker in portfolio.unique_tickers:
                 if ticker in self.price_cache:
                     del self.price_cache[ticker]
+                self._bad_tickers.pop(ticker, None)
             self.get_portfolio_prices(portfolio_id)
@@ -10,7 +10,7 @@ from typing import List, Optional
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class Holding:
     """
     Repräsentiert eine einzelne Position im Portfolio.
@@ -55,7 +55,7 @@ class Holding:
         return self.quantity * self.buy_price
 
 
-@dataclass
+@dataclass(slots=True)
 class Portfolio:
     """
     Repräsentiert ein Portfolio mit mehreren Holdings.
@@ -5,12 +5,15 @@ Speichert und lädt Portfolios aus dem Dateisystem.
 """
 
 import json
+import logging
 import os
 from pathlib import Path
 from typing import List, Optional
 
 from .models import Portfolio
 
+logger = logging.getLogger(__name__)
+
 
 class PortfolioStorage:
     """
@@ -40,15 +43,47 @@ class PortfolioStorage:
         """Gibt den Dateipfad für ein Portfolio zurück."""
         return self.storage_dir / f"{portfolio_id}.json"
 
+    @staticmethod
+    def _dumps(value) -> str:
+        """Serialisiert einen einzelnen Wert als kompaktes JSON."""
+        return json.dumps(value, ensure_ascii=False)
+
+    def _write_portfolio(self, f, portfolio: Portfolio) -> None:
+        """
+        Schreibt ein Portfolio holding-weise in eine geöffnete Datei.
+
+        Es wird nie das komplette Portfolio-Dictionary aufgebaut, der
+        Speicherbedarf bleibt dadurch unabhängig von der Anzahl der Positionen.
+        """
+        f.write('{\n  "name": ')
+        f.write(self._dumps(portfolio.name))
+        f.write(',\n  "holdings": [')
+        for i, holding in enumerate(portfolio.holdings):
+            if i:
+                f.write(',')
+            f.write('\n    ')
+            f.write(self._dumps(holding.to_dict()))
+        f.write('\n  ],\n  "benchmark_ticker": ')
+        f.write(self._dumps(portfolio.benchmark_ticker))
+        f.write(',\n  "id": ')
+        f.write(self._dumps(portfolio.id))
+        f.write(',\n  "created_at": ')
+        f.write(self._dumps(portfolio.created_at))
+        f.write('\n}\n')
+
     def save(self, portfolio: Portfolio) -> bool:
-        """Speichert ein Portfolio als JSON-Datei."""
+        """Speichert ein Portfolio atomar als JSON-Datei."""
+        file_path = self._get_file_path(portfolio.id)
+        tmp_path = file_path.with_name(file_path.name + '.tmp')
         try:
-            file_path = self._get_file_path(portfolio.id)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(portfolio.to_dict(), f, indent=2, ensure_ascii=False)
+            with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                self._write_portfolio(f, portfolio)
+            os.replace(tmp_path, file_path)
             return True
         except Exception as e:
-            print(f"Fehler beim Speichern des Portfolios: {e}")
+            logger.warning("Fehler beim Speichern des Portfolios %s", portfolio.id, exc_info=e)
+            if tmp_path.exists():
+                tmp_path.unlink()
             return False
 
     def load(self, portfolio_id: str) -> Optional[Portfolio]:
@@ -62,7 +97,7 @@ class PortfolioStorage:
                 data = json.load(f)
             return Portfolio.from_dict(data)
         except Exception as e:
-            print(f"Fehler beim Laden des Portfolios {portfolio_id}: {e}")
+            logger.warning("Fehler beim Laden des Portfolios %s", portfolio_id, exc_info=e)
             return None
 
     def delete(self, portfolio_id: str) -> bool:
@@ -74,7 +109,7 @@ class PortfolioStorage:
                 return True
             return False
         except Exception as e:
-            print(f"Fehler beim Löschen des Portfolios {portfolio_id}: {e}")
+            logger.warning("Fehler beim Löschen des Portfolios %s", portfolio_id, exc_info=e)
             return False
 
     def list_all(self) -> List[Portfolio]:
@@ -87,7 +122,7 @@ class PortfolioStorage:
                 if portfolio:
                     portfolios.append(portfolio)
         except Exception as e:
-            print(f"Fehler beim Auflisten der Portfolios: {e}")
+            logger.warning("Fehler beim Auflisten der Portfolios", exc_info=e)
 
         portfolios.sort(key=lambda p: p.created_at, reverse=True)
         return portfolios
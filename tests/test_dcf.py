@@ -0,0 +1,105 @@
+"""
+Unit tests for the DCF valuation.
+"""
+import pytest
+import pandas as pd
+
+from stock_dashboard.calculations.dcf_valuation import DCFValuation
+
+
+@pytest.fixture
+def financial_data():
+    """Minimal financial statements as returned by GetClosingPrices."""
+    years = pd.to_datetime(['2024-12-31', '2023-12-31'])
+    cashflow = pd.DataFrame(
+        [[100.0, 90.0], [150.0, 140.0]],
+        index=['Free Cash Flow', 'Operating Cash Flow'],
+        columns=years
+    )
+    balance_sheet = pd.DataFrame(
+        [[50.0, 40.0], [200.0, 210.0]],
+        index=['Cash And Cash Equivalents', 'Total Debt'],
+        columns=years
+    )
+    return {
+        'cashflow': cashflow,
+        'balance_sheet': balance_sheet,
+        'financials': pd.DataFrame(),
+        'Outstanding Shares': 10.0,
+    }
+
+
+def reference_dcf(fcf, cash, debt, shares, forecast_years, discount_rate, growth_rate, perpetual_growth_rate):
+    """Straightforward loop implementation used as reference."""
+    cashflows = [
+        fcf * (1 + growth_rate) ** year / (1 + discount_rate) ** year
+        for year in range(1, forecast_years + 1)
+    ]
+    final_fcf = fcf * (1 + growth_rate) ** forecast_years
+    terminal_value = final_fcf * (1 + perpetual_growth_rate) / (discount_rate - perpetual_growth_rate)
+    discounted_terminal_value = terminal_value / (1 + discount_rate) ** forecast_years
+    enterprise_value = sum(cashflows) + discounted_terminal_value
+    equity_value = enterprise_value - debt + cash
+    return enterprise_value, equity_value, equity_value / shares, cashflows
+
+
+class TestDCFValuation:
+    """Test DCFValuation.calculate_dcf."""
+
+    def test_matches_reference(self, financial_data):
+        result = DCFValuation.calculate_dcf(financial_data, 'TEST', discount_rate=0.08, growth_rate=0.03)
+        ev, eq, ips, cashflows = reference_dcf(100.0, 50.0, 200.0, 10.0, 5, 0.08, 0.03, 0.02)
+
+        assert result['enterprise_value'] == pytest.approx(ev)
+        assert result['equity_value'] == pytest.approx(eq)
+        assert result['intrinsic_value_per_share'] == pytest.approx(ips)
+        assert result['cashflows']['discounted_fcf'] == pytest.approx(cashflows)
+        assert result['cashflows']['projected_fcf'] == pytest.approx(
+            [100.0 * 1.03 ** year for year in range(1, 6)]
+        )
+
+    def test_cashflow_count_matches_forecast_years(self, financial_data):
+        result = DCFValuation.calculate_dcf(financial_data, 'TEST', forecast_years=7)
+        assert list(result['cashflows']['year']) == list(range(1, 8))
+        assert len(result['cashflows']['discounted_fcf']) == 7
+
+    def test_missing_fields_default_to_zero(self, financial_data):
+        financial_data['balance_sheet'] = financial_data['balance_sheet'].drop('Total Debt')
+        result = DCFValuation.calculate_dcf(financial_data, 'TEST')
+        _, eq, _, _ = reference_dcf(100.0, 50.0, 0.0, 10.0, 5, 0.065, 0.02, 0.02)
+
+        assert result['equity_value'] == pytest.approx(eq)
+
+    def test_missing_free_cash_flow_raises(self, financial_data):
+        financial_data['cashflow'] = financial_data['cashflow'].drop('Free Cash Flow')
+        with pytest.raises(ValueError, match='Free Cash Flow'):
+            DCFValuation.calculate_dcf(financial_data, 'TEST')
+
+    def test_non_positive_shares_raise(self, financial_data):
+        financial_data['Outstanding Shares'] = 0
+        with pytest.raises(ValueError):
+            DCFValuation.calculate_dcf(financial_data, 'TEST')
+
+    def test_discount_rate_must_exceed_perpetual_growth(self, financial_data):
+        with pytest.raises(ValueError):
+            DCFValuation.calculate_dcf(financial_data, 'TEST', discount_rate=0.02, perpetual_growth_rate=0.02)
+        with pytest.raises(ValueError):
+            DCFValuation.calculate_dcf_batch([100.0], [0.0], [0.0], [1.0], discount_rate=0.01, perpetual_growth_rate=0.02)
+
+    def test_batch_matches_single(self, financial_data):
+        single = DCFValuation.calculate_dcf(financial_data, 'TEST')
+        batch = DCFValuation.calculate_dcf_batch(
+            fcfs=[100.0, 250.0],
+            cashes=[50.0, 0.0],
+            debts=[200.0, 100.0],
+            shares=[10.0, 5.0]
+        )
+        _, _, ips_second, _ = reference_dcf(250.0, 0.0, 100.0, 5.0, 5, 0.065, 0.02, 0.02)
+
+        assert batch['enterprise_value'][0] == pytest.approx(single['enterprise_value'])
+        assert batch['intrinsic_value_per_share'][0] == pytest.approx(single['intrinsic_value_per_share'])
+        assert batch['intrinsic_value_per_share'][1] == pytest.approx(ips_second)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,61 @@
+"""
+Unit tests for LTTB downsampling of chart series.
+"""
+import pytest
+import numpy as np
+
+from stock_dashboard.visualization.downsampling import lttb_indices, MAX_CHART_POINTS
+
+
+@pytest.fixture(scope='module')
+def random_walk():
+    """Long price-like series, well above MAX_CHART_POINTS."""
+    rng = np.random.default_rng(42)
+    return 100 * np.cumprod(1 + rng.normal(0.0005, 0.02, 10_000))
+
+
+class TestLTTBIndices:
+    """Test lttb_indices selection."""
+
+    @pytest.mark.parametrize('n_out', [3, 10, 500, MAX_CHART_POINTS])
+    def test_output_length(self, random_walk, n_out):
+        assert len(lttb_indices(random_walk, n_out)) == n_out
+
+    def test_default_length(self, random_walk):
+        assert len(lttb_indices(random_walk)) == MAX_CHART_POINTS
+
+    @pytest.mark.parametrize('n_out', [3, 10, 500, 9_999])
+    def test_keeps_first_and_last(self, random_walk, n_out):
+        keep = lttb_indices(random_walk, n_out)
+        assert keep[0] == 0
+        assert keep[-1] == len(random_walk) - 1
+
+    @pytest.mark.parametrize('n_out', [3, 10, 500, 9_999])
+    def test_strictly_increasing(self, random_walk, n_out):
+        keep = lttb_indices(random_walk, n_out)
+        assert np.all(np.diff(keep) > 0)
+
+    @pytest.mark.parametrize('n, n_out', [(0, 10), (5, 10), (10, 10), (100, 2), (100, 0)])
+    def test_short_input_passed_through(self, n, n_out):
+        keep = lttb_indices(np.arange(n, dtype=float), n_out)
+        np.testing.assert_array_equal(keep, np.arange(n))
+
+    def test_handles_nan(self, random_walk):
+        y = random_walk.copy()
+        y[:50] = np.nan           # leading gap, e.g. warm-up of a rolling indicator
+        y[4_000:4_200] = np.nan   # gap spanning whole buckets
+        keep = lttb_indices(y, 200)
+
+        assert len(keep) == 200
+        assert keep[0] == 0
+        assert keep[-1] == len(y) - 1
+        assert np.all(np.diff(keep) > 0)
+
+    def test_keeps_spike(self):
+        y = np.zeros(10_000)
+        y[6_543] = 50.0
+        y[2_345] = -50.0
+        keep = lttb_indices(y, 100)
+
+        assert 6_543 in keep
+        assert 2_345 in keep
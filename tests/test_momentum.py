@@ -14,7 +14,7 @@ from stock_dashboard.calculations.momentum_strategy import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_prices():
     """Generate sample price series for testing."""
     np.random.seed(42)
@@ -25,19 +25,34 @@ def sample_prices():
     return pd.Series(prices.values, index=dates, name='Close')
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
+def default_run(sample_prices):
+    """Default-parameter TSM run on sample_prices, shared by the read-only tests."""
+    tsm = TimeSeriesMomentum()
+    signals = tsm.calculate_signals(sample_prices)
+    returns = tsm.calculate_strategy_returns(signals)
+    return tsm, signals, returns
+
+
+@pytest.fixture(scope='session')
+def default_signals(default_run):
+    """Signals of the default-parameter run."""
+    return default_run[1]
+
+
+@pytest.fixture(scope='session')
 def trending_up_prices():
     """Generate consistently upward trending prices."""
     dates = pd.date_range('2020-01-01', periods=300, freq='B')
-    prices = 100 * (1.001 ** np.arange(300))  # 0.1% daily growth
+    prices = 100 * np.exp(np.log1p(0.001) * np.arange(300, dtype=np.float64))  # 0.1% daily growth
     return pd.Series(prices, index=dates, name='Close')
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def trending_down_prices():
     """Generate consistently downward trending prices."""
     dates = pd.date_range('2020-01-01', periods=300, freq='B')
-    prices = 100 * (0.999 ** np.arange(300))  # 0.1% daily decline
+    prices = 100 * np.exp(np.log1p(-0.001) * np.arange(300, dtype=np.float64))  # 0.1% daily decline
     return pd.Series(prices, index=dates, name='Close')
 
 
@@ -82,9 +97,8 @@ class TestTimeSeriesMomentum:
         with pytest.raises(ValueError, match="Price series cannot be empty"):
             tsm.calculate_signals(pd.Series(dtype=float))
 
-    def test_signal_generation_returns_dataframe(self, sample_prices):
-        tsm = TimeSeriesMomentum()
-        signals = tsm.calculate_signals(sample_prices)
+    def test_signal_generation_returns_dataframe(self, default_signals):
+        signals = default_signals
 
         assert isinstance(signals, pd.DataFrame)
         assert 'close' in signals.columns
@@ -101,9 +115,8 @@ class TestTimeSeriesMomentum:
         signals = tsm.calculate_signals(sample_prices)
 
         # Signals should be 0 or 1 only (after shift, may have NaN at start)
-        valid_signals = signals['signal'].dropna()
-        assert (valid_signals >= 0).all()
-        assert (valid_signals <= 1).all()
+        valid_signals = signals['signal'].dropna().to_numpy()
+        assert np.all((valid_signals == 0) | (valid_signals == 1))
 
     def test_signal_values_long_short(self, sample_prices):
         """Test that Long/Short mode can generate -1, 0, or 1 signals."""
@@ -111,8 +124,8 @@ class TestTimeSeriesMomentum:
         tsm = TimeSeriesMomentum(params)
         signals = tsm.calculate_signals(sample_prices)
 
-        valid_signals = signals['signal'].dropna()
-        assert valid_signals.isin([-1, 0, 1]).all()
+        valid_signals = signals['signal'].dropna().to_numpy()
+        assert np.all((valid_signals == -1) | (valid_signals == 0) | (valid_signals == 1))
 
     def test_volatility_scaling_caps_position(self, sample_prices):
         """Test that position size is capped at 2.0."""
@@ -120,9 +133,8 @@ class TestTimeSeriesMomentum:
         tsm = TimeSeriesMomentum(params)
         signals = tsm.calculate_signals(sample_prices)
 
-        valid_positions = signals['position_size'].dropna()
-        assert (valid_positions <= 2.0).all()
-        assert (valid_positions >= 0.0).all()
+        valid_positions = signals['position_size'].dropna().to_numpy()
+        assert np.all((valid_positions >= 0.0) & (valid_positions <= 2.0))
 
     def test_volatility_scaling_disabled(self, sample_prices):
         """Test that position size equals signal when vol scaling disabled."""
@@ -131,13 +143,11 @@ class TestTimeSeriesMomentum:
         signals = tsm.calculate_signals(sample_prices)
 
         # Position size should be 0 or 1 (absolute value of signal)
-        valid_positions = signals['position_size'].dropna()
-        assert valid_positions.isin([0.0, 1.0]).all()
+        valid_positions = signals['position_size'].dropna().to_numpy()
+        assert np.all((valid_positions == 0.0) | (valid_positions == 1.0))
 
-    def test_strategy_returns_calculation(self, sample_prices):
-        tsm = TimeSeriesMomentum()
-        signals = tsm.calculate_signals(sample_prices)
-        returns = tsm.calculate_strategy_returns(signals)
+    def test_strategy_returns_calculation(self, default_run):
+        _, _, returns = default_run
 
         assert isinstance(returns, pd.DataFrame)
         assert 'strategy_return' in returns.columns
@@ -146,19 +156,16 @@ class TestTimeSeriesMomentum:
         assert 'cumulative_benchmark' in returns.columns
         assert 'drawdown' in returns.columns
 
-    def test_cumulative_returns_start_at_100(self, sample_prices):
-        tsm = TimeSeriesMomentum()
-        signals = tsm.calculate_signals(sample_prices)
-        returns = tsm.calculate_strategy_returns(signals)
+    def test_cumulative_returns_start_at_100(self, default_run):
+        _, _, returns = default_run
 
         # First non-NaN value should be close to 100
-        first_valid_idx = returns['cumulative_strategy'].first_valid_index()
-        assert abs(returns.loc[first_valid_idx, 'cumulative_strategy'] - 100) < 1
+        cumulative = returns['cumulative_strategy'].to_numpy()
+        first_valid = int(np.argmax(np.isfinite(cumulative)))
+        assert abs(cumulative[first_valid] - 100) < 1
 
-    def test_performance_metrics_calculation(self, sample_prices):
-        tsm = TimeSeriesMomentum()
-        signals = tsm.calculate_signals(sample_prices)
-        returns = tsm.calculate_strategy_returns(signals)
+    def test_performance_metrics_calculation(self, default_run):
+        tsm, _, returns = default_run
         metrics = tsm.calculate_performance_metrics(returns)
 
         assert isinstance(metrics, TSMPerformanceMetrics)
@@ -169,19 +176,15 @@ class TestTimeSeriesMomentum:
         assert metrics.win_rate is not None
         assert metrics.num_trades >= 0
 
-    def test_max_drawdown_never_positive(self, sample_prices):
+    def test_max_drawdown_never_positive(self, default_run):
         """Test max drawdown is always <= 0."""
-        tsm = TimeSeriesMomentum()
-        signals = tsm.calculate_signals(sample_prices)
-        returns = tsm.calculate_strategy_returns(signals)
+        tsm, _, returns = default_run
         metrics = tsm.calculate_performance_metrics(returns)
 
         assert metrics.max_drawdown <= 0
 
-    def test_win_rate_between_0_and_1(self, sample_prices):
-        tsm = TimeSeriesMomentum()
-        signals = tsm.calculate_signals(sample_prices)
-        returns = tsm.calculate_strategy_returns(signals)
+    def test_win_rate_between_0_and_1(self, default_run):
+        tsm, _, returns = default_run
         metrics = tsm.calculate_performance_metrics(returns)
 
         assert 0 <= metrics.win_rate <= 1
@@ -210,9 +213,8 @@ class TestTimeSeriesMomentum:
         # Should be mostly cash in downtrend
         assert cash_ratio > 0.7
 
-    def test_trade_log_generation(self, sample_prices):
-        tsm = TimeSeriesMomentum()
-        signals = tsm.calculate_signals(sample_prices)
+    def test_trade_log_generation(self, default_run):
+        tsm, signals, _ = default_run
         trade_log = tsm.generate_trade_log(signals)
 
         assert isinstance(trade_log, pd.DataFrame)
@@ -246,6 +248,26 @@ class TestScenarioComparison:
         assert 'Szenario' in results_df.columns
         assert 'Total Return' in results_df.columns
 
+    def test_run_all_parallel_matches_serial(self, sample_prices, monkeypatch):
+        from stock_dashboard.calculations import momentum_strategy
+
+        def build():
+            comparison = ScenarioComparison()
+            comparison.add_scenario('Short Lookback', TSMParameters(lookback_months=3))
+            comparison.add_scenario('Long Lookback', TSMParameters(lookback_months=12))
+            comparison.add_scenario('Long/Short', TSMParameters(position_type='long_short'))
+            return comparison
+
+        serial_comparison = build()
+        serial = serial_comparison.run_all(sample_prices)
+        # Below the real threshold: force the spawned worker pool
+        monkeypatch.setattr(momentum_strategy, 'PARALLEL_MIN_SCENARIOS', 2)
+        parallel_comparison = build()
+        parallel = parallel_comparison.run_all(sample_prices)
+
+        pd.testing.assert_frame_equal(parallel, serial)
+        assert parallel_comparison.results == serial_comparison.results
+
     def test_get_best_scenario(self, sample_prices):
         comparison = ScenarioComparison()
         comparison.add_scenario('Scenario A', TSMParameters(lookback_months=3))
@@ -268,9 +290,9 @@ class TestHoldingPeriod:
         signals = tsm.calculate_signals(sample_prices)
 
         # Count signal changes
-        signal_changes = signals['signal'].diff().fillna(0) != 0
+        signal_changes = int((np.diff(signals['signal'].dropna().to_numpy()) != 0).sum())
         # Should have some signal changes
-        assert signal_changes.sum() > 0
+        assert signal_changes > 0
 
     def test_monthly_rebalancing_reduces_trades(self, sample_prices):
         """Test that monthly rebalancing reduces number of signal changes."""
@@ -283,8 +305,8 @@ class TestHoldingPeriod:
         signals_daily = tsm_daily.calculate_signals(sample_prices)
         signals_monthly = tsm_monthly.calculate_signals(sample_prices)
 
-        changes_daily = (signals_daily['signal'].diff().fillna(0) != 0).sum()
-        changes_monthly = (signals_monthly['signal'].diff().fillna(0) != 0).sum()
+        changes_daily = int((np.diff(signals_daily['signal'].dropna().to_numpy()) != 0).sum())
+        changes_monthly = int((np.diff(signals_monthly['signal'].dropna().to_numpy()) != 0).sum())
 
         # Monthly should have fewer or equal signal changes
         assert changes_monthly <= changes_daily
@@ -0,0 +1,135 @@
+"""
+Unit tests for the portfolio manager (snapshot and price lookup).
+"""
+import pytest
+import pandas as pd
+import requests
+
+from stock_dashboard.portfolio import manager as manager_module
+from stock_dashboard.portfolio.manager import PortfolioManager
+from stock_dashboard.portfolio.calculations import PortfolioCalculations
+
+
+# Current prices served instead of Yahoo; CCC has no price
+PRICES = {'AAA': 120.0, 'BBB': 40.0, '^GSPC': 5000.0}
+
+
+# Last two closes served instead of Yahoo history, for the daily change
+HISTORY = {'AAA': [118.0, 120.0], 'BBB': [41.0, 40.0]}
+
+
+def _history(ticker, period='1y'):
+    closes = HISTORY.get(ticker)
+    if closes is None:
+        return None
+    return pd.DataFrame({'Close': closes}, index=pd.bdate_range('2024-06-03', periods=len(closes)))
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """PortfolioManager on a temporary storage directory without network access."""
+    manager = PortfolioManager(storage_dir=str(tmp_path))
+    monkeypatch.setattr(manager, 'get_current_price', PRICES.get)
+    monkeypatch.setattr(manager, 'get_historical_prices', _history)
+    return manager
+
+
+@pytest.fixture
+def calculations(manager):
+    return PortfolioCalculations(manager)
+
+
+@pytest.fixture
+def portfolio(manager):
+    """Portfolio with a repeated ticker, a loss and a position without price."""
+    portfolio = manager.create_portfolio('Test')
+    manager.add_holding(portfolio.id, 'AAA', 10, 100.0, '2024-01-02')
+    manager.add_holding(portfolio.id, 'BBB', 5, 50.0, '2024-02-01')
+    manager.add_holding(portfolio.id, 'AAA', 2, 110.0, '2024-03-01')
+    manager.add_holding(portfolio.id, 'CCC', 3, 30.0, '2024-04-01')
+    return portfolio
+
+
+class TestSnapshot:
+    """Test PortfolioCalculations.calculate_snapshot."""
+
+    def test_positions(self, calculations, portfolio):
+        snapshot = calculations.calculate_snapshot(portfolio, PRICES)
+
+        assert snapshot['holding_ids'] == [h.id for h in portfolio.holdings]
+        assert snapshot['tickers'] == ['AAA', 'BBB', 'AAA', 'CCC']
+        assert snapshot['prices'] == [120.0, 40.0, 120.0, None]
+        assert snapshot['values'] == pytest.approx([1200.0, 200.0, 240.0, 90.0])
+        assert snapshot['cost'] == pytest.approx([1000.0, 250.0, 220.0, 90.0])
+        assert snapshot['pnl'] == pytest.approx([200.0, -50.0, 20.0, 0.0])
+        assert snapshot['pnl_percent'] == pytest.approx([20.0, -20.0, 100 * 20 / 220, 0.0])
+
+    def test_totals_and_weights(self, calculations, portfolio):
+        snapshot = calculations.calculate_snapshot(portfolio, PRICES)
+
+        assert snapshot['total'] == pytest.approx(1730.0)
+        assert snapshot['total_cost'] == pytest.approx(1560.0)
+        assert snapshot['total_pnl'] == pytest.approx(170.0)
+        assert snapshot['total_pnl_percent'] == pytest.approx(100 * 170 / 1560)
+        assert snapshot['weights'] == pytest.approx([v / 1730.0 for v in (1200.0, 200.0, 240.0, 90.0)])
+
+    def test_allocation_aggregates_tickers(self, calculations, portfolio):
+        snapshot = calculations.calculate_snapshot(portfolio, PRICES)
+
+        assert [a['ticker'] for a in snapshot['allocation']] == ['AAA', 'BBB', 'CCC']
+        assert [a['value'] for a in snapshot['allocation']] == pytest.approx([1440.0, 200.0, 90.0])
+
+    def test_daily_change(self, calculations, portfolio):
+        snapshot = calculations.calculate_snapshot(portfolio, PRICES)
+
+        # (120 - 118) * 12 AAA + (40 - 41) * 5 BBB; CCC has no history
+        assert snapshot['daily_change'] == pytest.approx(19.0)
+        assert snapshot['daily_change_percent'] == pytest.approx(100 * 19 / (118 * 12 + 41 * 5))
+
+    def test_empty_portfolio(self, manager, calculations):
+        portfolio = manager.create_portfolio('Leer')
+        snapshot = calculations.calculate_snapshot(portfolio, PRICES)
+
+        assert snapshot['total'] == 0.0
+        assert snapshot['weights'] == []
+        assert snapshot['allocation'] == []
+        assert snapshot['daily_change'] == 0.0
+
+
+class _EmptyTicker:
+    """yfinance.Ticker stand-in for a symbol Yahoo does not know."""
+    info = {}
+
+    def __init__(self, ticker):
+        pass
+
+    def history(self, period):
+        return pd.DataFrame()
+
+
+class TestCurrentPrice:
+    """Test negative caching in get_current_price."""
+
+    @pytest.fixture
+    def offline_manager(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(manager_module.yf, 'Ticker', _EmptyTicker)
+        return PortfolioManager(storage_dir=str(tmp_path))
+
+    def test_unknown_ticker_marked_bad(self, offline_manager, monkeypatch):
+        monkeypatch.setattr(offline_manager, '_fetch_quote', lambda ticker: None)
+
+        assert offline_manager.get_current_price('XXXX') is None
+        assert 'XXXX' in offline_manager._bad_tickers
+
+    def test_network_error_not_marked_bad(self, offline_manager, monkeypatch):
+        def fail(ticker):
+            raise requests.ConnectionError('offline')
+
+        monkeypatch.setattr(offline_manager, '_fetch_quote', fail)
+
+        assert offline_manager.get_current_price('AAA') is None
+        assert 'AAA' not in offline_manager._bad_tickers
+
+        # Once the network is back, the price is fetched again
+        monkeypatch.setattr(offline_manager, '_fetch_quote', lambda ticker: 123.0)
+        assert offline_manager.get_current_price('AAA') == 123.0
@@ -0,0 +1,142 @@
+"""
+Unit tests for RSI Mean-Reversion strategy implementation.
+"""
+import pytest
+import pandas as pd
+import numpy as np
+
+from stock_dashboard.calculations.rsi_mean_reversion import (
+    RSIMeanReversion,
+    RSIMeanReversionParameters,
+    _rolling_mean,
+    _wilder_smooth
+)
+
+
+@pytest.fixture(scope='session')
+def sample_prices():
+    """Generate sample price series for testing."""
+    rng = np.random.default_rng(42)
+    dates = pd.date_range('2020-01-01', periods=500, freq='B')
+    returns = rng.normal(0.0003, 0.02, 500)
+    return pd.Series(100 * np.cumprod(1 + returns), index=dates, name='Close')
+
+
+@pytest.fixture(scope='session')
+def default_run(sample_prices):
+    """Default-parameter RSI run on sample_prices, shared by the read-only tests."""
+    strategy = RSIMeanReversion()
+    signals = strategy.calculate_signals(sample_prices)
+    trades = strategy.simulate_trades(signals)
+    returns = strategy.calculate_returns(signals)
+    return strategy, signals, trades, returns
+
+
+class TestWilderSmooth:
+    """Test the Wilder smoothing kernel."""
+
+    @pytest.mark.parametrize('period', [2, 14, 30])
+    def test_matches_pandas_ewm(self, sample_prices, period):
+        values = np.abs(sample_prices.diff().fillna(0.0).to_numpy())
+        result = _wilder_smooth(values, period)
+
+        # Wilder = EWM with alpha=1/period, seeded with the mean of the first period values
+        seeded = np.concatenate(([values[:period].mean()], values[period:]))
+        expected = pd.Series(seeded).ewm(alpha=1 / period, adjust=False).mean().to_numpy()
+
+        assert np.isnan(result[:period - 1]).all()
+        np.testing.assert_allclose(result[period - 1:], expected, rtol=1e-12)
+
+    def test_series_shorter_than_period(self):
+        result = _wilder_smooth(np.ones(5), 14)
+        assert len(result) == 5
+        assert np.isnan(result).all()
+
+    def test_rsi_in_range(self, default_run):
+        _, signals, _, _ = default_run
+        rsi = signals['rsi'].dropna().to_numpy()
+
+        assert len(rsi) > 0
+        assert np.all((rsi >= 0) & (rsi <= 100))
+
+
+class TestRollingMean:
+    """Test the cumulative-sum moving average."""
+
+    @pytest.mark.parametrize('window', [1, 5, 20, 500])
+    def test_matches_pandas_rolling(self, sample_prices, window):
+        result = _rolling_mean(sample_prices.to_numpy(), window)
+        expected = sample_prices.rolling(window).mean().to_numpy()
+
+        np.testing.assert_allclose(result, expected, rtol=1e-10, equal_nan=True)
+
+    def test_window_longer_than_series(self, sample_prices):
+        result = _rolling_mean(sample_prices.to_numpy()[:10], 20)
+        assert len(result) == 10
+        assert np.isnan(result).all()
+
+
+class TestRSISignals:
+    """Test signal generation."""
+
+    def test_bands_match_pandas_rolling(self, sample_prices, default_run):
+        strategy, signals, _, _ = default_run
+        rolling = sample_prices.rolling(strategy.params.ma_period)
+
+        np.testing.assert_allclose(signals['ma'].to_numpy(), rolling.mean().to_numpy(),
+                                   rtol=1e-10, equal_nan=True)
+        np.testing.assert_allclose(signals['std'].to_numpy(), rolling.std().to_numpy(),
+                                   rtol=1e-8, equal_nan=True)
+
+    def test_ma_window_longer_than_series(self, sample_prices):
+        """Windows beyond the series length fall back to pandas and give only NaN."""
+        prices = sample_prices.iloc[:30]
+        strategy = RSIMeanReversion(RSIMeanReversionParameters(ma_period=50))
+        signals = strategy.calculate_signals(prices)
+
+        assert len(signals) == len(prices)
+        assert signals['ma'].isna().all()
+        assert signals['std'].isna().all()
+        assert np.all(signals['raw_signal'].to_numpy() == 0)
+
+    def test_signal_values(self, default_run):
+        _, signals, _, _ = default_run
+        raw = signals['raw_signal'].to_numpy()
+        assert np.all((raw == -1) | (raw == 0) | (raw == 1))
+
+    def test_empty_prices_raise(self):
+        with pytest.raises(ValueError):
+            RSIMeanReversion().calculate_signals(pd.Series(dtype=float))
+
+
+class TestRSIReturns:
+    """Test return calculation."""
+
+    def test_cumulative_returns_start_at_100(self, default_run):
+        _, _, _, returns = default_run
+
+        assert returns['cumulative_strategy'].iloc[0] == pytest.approx(100)
+        assert returns['cumulative_benchmark'].iloc[0] == pytest.approx(100)
+
+    def test_benchmark_tracks_prices(self, sample_prices, default_run):
+        _, _, _, returns = default_run
+        expected = sample_prices.to_numpy() / sample_prices.iloc[0] * 100
+
+        np.testing.assert_allclose(returns['cumulative_benchmark'].to_numpy(), expected, rtol=1e-10)
+
+    def test_positions_follow_trades(self, default_run):
+        """Daily strategy returns match a per-trade date-mask reference."""
+        _, signals, trades, returns = default_run
+        assert not trades.empty
+
+        position = np.zeros(len(signals))
+        for trade in trades.itertuples():
+            mask = (signals.index >= trade.entry_date) & (signals.index <= trade.exit_date)
+            position[mask] += 1.0 if trade.direction == 'Long' else -1.0
+        expected = np.where(position != 0, signals['returns'].to_numpy() * position, 0.0)
+
+        np.testing.assert_allclose(returns['strategy_return'].to_numpy(), expected, equal_nan=True)
+
+    def test_drawdown_non_positive(self, default_run):
+        _, _, _, returns = default_run
+        assert np.all(returns['drawdown'].to_numpy() <= 0)
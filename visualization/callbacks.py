@@ -5,8 +5,15 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from dash.dependencies import Input, Output, State
 from dash import html, ctx
+from dash.exceptions import PreventUpdate
 import plotly.graph_objs as go
+import numpy as np
+import pandas as pd
+import json
+import time
 from datetime import datetime, timedelta
+from dataclasses import astuple
+from functools import lru_cache
 from data.fetch_data import GetClosingPrices
 from data.macro_data import fetch_vix_data, fetch_yield_curve_data
 from config.settings import FRED_API_KEY
@@ -14,8 +21,240 @@ from calculations.momentum_strategy import (
     TimeSeriesMomentum, TSMParameters, ScenarioComparison
 )
 from visualization.components.tsm_components import create_metric_card
+from visualization.downsampling import lttb_indices
+
+# Wiederverwendete Layout-Bausteine der Charts
+_TEMPLATE = 'plotly_white'
+_STD_MARGIN = dict(l=20, r=20, t=40, b=20)
+_MONEY_AXIS = dict(tickformat=".2s", hoverformat=".2s")
+
+# Grundlayout des Kurscharts; wird mit den Rohdaten an den Browser geschickt,
+# weil das Template dort nicht per Name aufgelöst werden kann
+# Zeitraumwahl über Buttons, die nur den Achsenbereich setzen. Ersetzt den
+# Rangeslider: der zeichnet jede Reihe ein zweites Mal und kann keine
+# WebGL-Reihen (scattergl) darstellen
+_RANGE_SELECTOR = dict(buttons=[
+    dict(count=1, label='1M', step='month', stepmode='backward'),
+    dict(count=6, label='6M', step='month', stepmode='backward'),
+    dict(count=1, label='1J', step='year', stepmode='backward'),
+    dict(step='all', label='Alle')
+])
+
+PRICE_PLOT_LAYOUT = go.Layout(
+    xaxis_title='Datum',
+    hovermode="x unified",
+    template=_TEMPLATE,
+    xaxis_rangeslider_visible=False,
+    xaxis_rangeselector=_RANGE_SELECTOR
+).to_plotly_json()
+
+# Grundlayout der Finanz- und Makrocharts (Template aufgelöst, siehe PRICE_PLOT_LAYOUT)
+BASE_CHART_LAYOUT = go.Layout(
+    template=_TEMPLATE,
+    margin=_STD_MARGIN
+).to_plotly_json()
+
+# Gemeinsame Layout-Argumente der TSM-Charts (für update_layout)
+TSM_CHART_LAYOUT = dict(
+    template=_TEMPLATE,
+    hovermode='x unified',
+    showlegend=True,
+    legend=dict(x=0.01, y=0.99),
+    margin=_STD_MARGIN
+)
+
+
+def _titled_figure(title):
+    """Leere Figur, die nur einen Hinweis als Titel zeigt."""
+    return {'data': [], 'layout': {'title': {'text': title}}}
+
+
+def _series_to_xy(series):
+    """Wandelt eine Jahresreihe (Bilanzstichtage) in JSON-fertige {'x': Jahre, 'y'} Listen um."""
+    return {
+        'x': pd.DatetimeIndex(series.index).strftime('%Y').tolist(),
+        'y': series.tolist()
+    }
+
+
+def _statement_rows(df, rows):
+    """
+    Holt die benötigten Zeilen eines Finanzberichts in einem Durchgang.
+
+    Returns:
+        dict Zeile -> Reihe (ohne NaN, nach Stichtag sortiert); fehlende Zeilen
+        sind nicht enthalten
+    """
+    if df is None:
+        return {}
+    return {row: df.loc[row].dropna().sort_index() for row in rows if row in df.index}
+
+
+def _bar_chart_js(key, name, color, title_prefix, y_label):
+    """Clientside-Funktion für ein Balkendiagramm aus einer Bilanzzeile im chart-data Store."""
+    return """
+        function(chartData) {
+            var store = chartData && chartData.financial;
+            if (!store) {
+                return {data: [], layout: {title: {text: 'Wählen Sie einen Ticker für Finanzdaten aus.'}}};
+            }
+            if (!store.available) {
+                return {data: [], layout: {title: {text: 'Keine Finanzdaten für ' + store.ticker + ' verfügbar'}}};
+            }
+            var s = store[%(key)s];
+            if (!s) {
+                return {data: [], layout: {title: {text: %(title)s + store.ticker + ' nicht verfügbar'}}};
+            }
+            var layout = Object.assign({}, store.layout, {
+                title: {text: %(title)s + store.ticker},
+                xaxis: {title: {text: 'Jahr'}, type: 'category'},
+                yaxis: Object.assign({title: {text: %(y_label)s}}, %(money_axis)s)
+            });
+            return {data: [{type: 'bar', x: s.x, y: s.y, name: %(name)s, marker: {color: %(color)s}}], layout: layout};
+        }
+        """ % {
+        'key': json.dumps(key),
+        'name': json.dumps(name),
+        'color': json.dumps(color),
+        'title': json.dumps(title_prefix),
+        'y_label': json.dumps(y_label),
+        'money_axis': json.dumps(_MONEY_AXIS)
+    }
+
+
+# Hintergrundfarben des Signal-Charts
+_LONG_FILL = 'rgba(0, 200, 0, 0.15)'
+_SHORT_FILL = 'rgba(200, 0, 0, 0.15)'
+
+
+def _signal_shapes(index, signal):
+    """
+    Hintergrund-Rechtecke für das Signal-Chart, ein Rechteck je Folge gleicher Signale.
+
+    Balken i (ab 1) färbt den Bereich index[i-1] bis index[i]; aufeinanderfolgende
+    Balken mit gleichem Vorzeichen werden zu einem Rechteck zusammengefasst.
+    Flat (0 oder NaN) bleibt ohne Hintergrund.
+    """
+    if len(signal) < 2:
+        return []
+    sign = np.sign(np.where(np.isnan(signal), 0.0, signal))[1:]
+    bounds = np.flatnonzero(np.diff(sign) != 0) + 1
+    starts = np.concatenate(([0], bounds))
+    ends = np.concatenate((bounds, [len(sign)]))
+    return [
+        dict(type='rect', xref='x', yref='y domain', x0=index[start], x1=index[end], y0=0, y1=1,
+             fillcolor=_LONG_FILL if sign[start] > 0 else _SHORT_FILL, layer='below', line_width=0)
+        for start, end in zip(starts, ends) if sign[start] != 0
+    ]
+
+
+# Dropdown-Optionen je Ticker; bereits bekannte Einträge werden wiederverwendet
+_OPTION_CACHE = {}
+
+# Wartezeit, bis eine Dropdown-Auswahl an die Server-Callbacks weitergegeben wird
+TICKER_DEBOUNCE_MS = 300
+
+# Makrodaten (VIX, FRED) zwischenspeichern: je Funktion nur der zuletzt geladene
+# Zeitraum, Funktionsname -> (Zeitpunkt, Starttag, Endtag, Daten). Höchstens ein
+# Eintrag pro Abruffunktion; abgelaufene Einträge werden beim Zugriff entfernt
+MACRO_CACHE_TTL_SECONDS = 60 * 60
+_macro_cache = {}
+
+
+def _cached_macro(fetch, start_date, end_date, *args):
+    """
+    Ruft fetch(start_date, end_date, *args) auf oder schneidet den Zeitraum aus
+    einem Ergebnis aus, das jünger als MACRO_CACHE_TTL_SECONDS ist und ihn
+    (tagesgenau) abdeckt. Nach dem Laden von 10 Jahren kommen 1, 2 und 5 Jahre
+    damit ohne weiteren Abruf aus.
+    """
+    key = fetch.__name__
+    start_day, end_day = start_date.date(), end_date.date()
+    now = time.monotonic()
+    hit = _macro_cache.get(key)
+    if hit is not None:
+        fetched_at, cached_start, cached_end, data = hit
+        if now - fetched_at >= MACRO_CACHE_TTL_SECONDS:
+            # Abgelaufen: Daten nicht bis zum nächsten erfolgreichen Abruf festhalten
+            _macro_cache.pop(key, None)
+        elif cached_start <= start_day and end_day <= cached_end:
+            return data.loc[start_date:end_date]
+    value = fetch(start_date, end_date, *args)
+    _macro_cache[key] = (now, start_day, end_day, value)
+    return value
+
 
 def register_callbacks(app, stock_manager):
+    @lru_cache(maxsize=512)
+    def _close_trace(ticker_symbol, version):
+        """
+        Liefert die (ausgedünnten) Schlusskurse eines Tickers JSON-fertig als {'name', 'x', 'y'}.
+
+        version ist stock_manager.get_ticker_version(ticker_symbol); nach einem
+        neuen Abruf dieses Tickers greifen alte Einträge dadurch nicht mehr,
+        Einträge anderer Ticker bleiben gültig.
+
+        Returns:
+            dict oder ein Fehlerkennzeichen: 'no_data', 'no_close'
+        """
+        df = stock_manager.get_data_for_ticker(ticker_symbol)
+        if df is None or df.empty:
+            return 'no_data'
+        if 'Close' not in df.columns:
+            return 'no_close'
+        # Lange Reihen per LTTB auf Bildschirmauflösung reduzieren; die Auswahl
+        # bleibt auch für die Basis-100-Darstellung gültig (lineare Skalierung)
+        closes = df['Close'].to_numpy()
+        keep = lttb_indices(closes)
+        dates = df.index[keep]
+        if getattr(dates, 'tz', None) is not None:
+            dates = dates.tz_localize(None)
+        return {
+            'name': ticker_symbol,
+            'x': dates.strftime('%Y-%m-%d').tolist(),
+            'y': closes[keep].tolist()
+        }
+
+    @lru_cache(maxsize=128)
+    def _fin(ticker_symbol, version):
+        """
+        Liefert die geplotteten Bilanzzeilen eines Tickers JSON-fertig für den chart-data Store.
+
+        Wie bei _close_trace macht version (Datenstand des Tickers) Einträge
+        nach einem neuen Abruf ungültig.
+        """
+        financial_data = stock_manager.get_financial_data_for_ticker(ticker_symbol)
+        if not financial_data:
+            return {'ticker': ticker_symbol, 'available': False}
+        rows = {
+            **_statement_rows(financial_data.get('cashflow'), ('Free Cash Flow',)),
+            **_statement_rows(financial_data.get('balance_sheet'), ('Total Debt',)),
+            **_statement_rows(financial_data.get('financials'), ('Total Revenue', 'Net Income'))
+        }
+        store = {
+            'ticker': ticker_symbol,
+            'available': True,
+            'layout': BASE_CHART_LAYOUT,
+            'fcf': _series_to_xy(rows['Free Cash Flow']) if 'Free Cash Flow' in rows else None,
+            'debt': _series_to_xy(rows['Total Debt']) if 'Total Debt' in rows else None,
+            'revenue': None
+        }
+        if 'Total Revenue' in rows and 'Net Income' in rows:
+            revenue_series = rows['Total Revenue']
+            net_income_series = rows['Net Income']
+            # Marge nur für Jahre mit beiden Werten, ohne pandas-Ausrichtung
+            common = revenue_series.index.intersection(net_income_series.index)
+            rev = revenue_series.reindex(common).to_numpy(dtype=float)
+            ni = net_income_series.reindex(common).to_numpy(dtype=float)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                net_margin = np.where(rev != 0, ni / rev * 100.0, 0.0)
+            store['revenue'] = {
+                'revenue': _series_to_xy(revenue_series),
+                'net_income': _series_to_xy(net_income_series),
+                'net_margin': _series_to_xy(pd.Series(net_margin, index=common))
+            }
+        return store
+
     @app.callback(
         Output('ticker-dropdown', 'options'),
         Output('ticker-dropdown', 'value'),
@@ -30,168 +269,201 @@ def register_callbacks(app, stock_manager):
             return current_options, current_selected_values, ""
         if not new_tickers_input:
             return current_options, current_selected_values, "Bitte geben Sie Ticker Symbole ein."
-        new_tickers_list = [t.strip().upper() for t in new_tickers_input.split(',') if t.strip()]
-        existing_tickers = [option['value'] for option in current_options]
+        # dict.fromkeys entfernt doppelte Eingaben und behält die Reihenfolge
+        new_tickers_list = list(dict.fromkeys(t.strip().upper() for t in new_tickers_input.split(',') if t.strip()))
+        existing_tickers = {option['value'] for option in current_options} if current_options else set()
         tickers_to_add = [t for t in new_tickers_list if t not in existing_tickers]
         if not tickers_to_add:
             return current_options, current_selected_values, "Alle eingegebenen Ticker sind bereits vorhanden."
-        for ticker in tickers_to_add:
-            if ticker not in stock_manager.ticker_list:
-                stock_manager.ticker_list.append(ticker)
-        original_start_date = stock_manager.start_date
-        original_end_date = stock_manager.end_date
-        stock_manager.start_date = (datetime.now() - timedelta(days=365*3)).strftime('%Y-%m-%d')
-        stock_manager.end_date = datetime.now().strftime('%Y-%m-%d')
-        stock_manager.fetch_historical_data()
-        stock_manager.start_date = original_start_date
-        stock_manager.end_date = original_end_date
+        stock_manager.add_tickers(tickers_to_add)
+        # Nur Ticker ohne geladene Daten abrufen (parallel): nach einem Neuladen der
+        # Seite sind die Optionen leer, die Daten im stock_manager aber noch vorhanden
+        tickers_to_fetch = [t for t in tickers_to_add if t not in stock_manager.historical_data]
+        if tickers_to_fetch:
+            stock_manager.fetch_historical_data(
+                tickers=tickers_to_fetch,
+                start=(datetime.now() - timedelta(days=365*3)).strftime('%Y-%m-%d'),
+                end=datetime.now().strftime('%Y-%m-%d')
+            )
         updated_available_tickers = [
             ticker for ticker in stock_manager.ticker_list
             if ticker in stock_manager.historical_data and not stock_manager.historical_data[ticker].empty
         ]
-        new_options = [{'label': ticker, 'value': ticker} for ticker in updated_available_tickers]
-        updated_selected_values = current_selected_values if current_selected_values else []
-        for ticker in tickers_to_add:
-            if ticker in updated_available_tickers and ticker not in updated_selected_values:
-                updated_selected_values.append(ticker)
+        available_set = set(updated_available_tickers)
+        for ticker in updated_available_tickers:
+            _OPTION_CACHE.setdefault(ticker, {'label': ticker, 'value': ticker})
+        new_options = [_OPTION_CACHE[ticker] for ticker in updated_available_tickers]
+        # Neue Liste statt die von Dash übergebene Auswahl zu verändern
+        selected = current_selected_values or []
+        selected_set = set(selected)
+        updated_selected_values = list(selected) + [
+            t for t in tickers_to_add if t in available_set and t not in selected_set
+        ]
         status_message = f"Ticker {', '.join(tickers_to_add)} hinzugefügt."
-        if any(t not in updated_available_tickers for t in tickers_to_add):
-            failed_tickers = [t for t in tickers_to_add if t not in updated_available_tickers]
+        failed_tickers = [t for t in tickers_to_add if t not in available_set]
+        if failed_tickers:
             status_message += f" (Hinweis: Daten konnten für {', '.join(failed_tickers)} nicht abgerufen werden.)"
         return new_options, updated_selected_values, status_message
 
+    # Schnelle Folgeänderungen im Dropdown zusammenfassen: erst wenn die Auswahl
+    # TICKER_DEBOUNCE_MS lang stabil ist, landet sie in ticker-debounced
+    app.clientside_callback(
+        """
+        function(value) {
+            var state = window._tickerDebounce = window._tickerDebounce || {};
+            if (state.timer) {
+                clearTimeout(state.timer);
+                state.resolve(window.dash_clientside.no_update);
+            }
+            return new Promise(function(resolve) {
+                state.resolve = resolve;
+                state.timer = setTimeout(function() {
+                    state.timer = null;
+                    resolve(value);
+                }, %d);
+            });
+        }
+        """ % TICKER_DEBOUNCE_MS,
+        Output('ticker-debounced', 'data'),
+        Input('ticker-dropdown', 'value')
+    )
+
     @app.callback(
-        Output('stock-price-plot', 'figure'),
+        Output('chart-data', 'data'),
         Output('plot-info-status', 'children'),
-        Input('ticker-dropdown', 'value'),
-        Input('relative-change-checkbox', 'value')
+        Input('ticker-debounced', 'data'),
+        State('chart-data', 'data')
     )
-    def update_graph(selected_tickers, relative_change_values):
-        relative_change_active = 'relative_change' in relative_change_values
+    def update_chart_data(selected_tickers, current_data):
+        """
+        Sammelt Schlusskurse und Finanzdaten der Auswahl in einem Store.
+
+        Ein Roundtrip pro Dropdown-Änderung; Kurs- und Finanzcharts baut der
+        Browser aus den jeweiligen Teilen ('prices', 'financial').
+        """
         if not selected_tickers:
-            return go.Figure(), "Bitte wählen Sie mindestens einen Ticker aus."
+            return {'prices': None, 'financial': None}, "Bitte wählen Sie mindestens einen Ticker aus."
         if not isinstance(selected_tickers, list):
             selected_tickers = [selected_tickers]
-        fig = go.Figure()
+        # Gleiche Auswahl auf gleichem Datenstand: Store und Charts bleiben, wie sie sind.
+        # Der Vergleich läuft über den Store der jeweiligen Sitzung, nicht über Prozesszustand
+        if (current_data and current_data.get('tickers') == selected_tickers
+                and current_data.get('version') == stock_manager.version):
+            raise PreventUpdate
+        series = []
         plot_info_messages = []
-        plot_title = 'Historische Schlusskurse'
-        y_axis_label = 'Schlusskurs ($)'
-        if relative_change_active:
-            plot_title = 'Relative Veränderung der Schlusskurse (Basis = 100)'
-            y_axis_label = 'Relative Veränderung (Index 100)'
         for ticker_symbol in selected_tickers:
-            df = stock_manager.get_data_for_ticker(ticker_symbol)
-            if df is None or df.empty:
+            trace_data = _close_trace(ticker_symbol, stock_manager.get_ticker_version(ticker_symbol))
+            if trace_data == 'no_data':
                 plot_info_messages.append(f"Keine Daten für {ticker_symbol} verfügbar.")
-                continue
-            if 'Close' in df.columns:
-                data_to_plot = df['Close']
-                if relative_change_active:
-                    first_value = data_to_plot.iloc[0]
-                    if first_value != 0:
-                        data_to_plot = (data_to_plot / first_value) * 100
-                    else:
-                        plot_info_messages.append(f"Warnung: Erster Schlusskurs für {ticker_symbol} ist Null.")
-                        continue
-                fig.add_trace(go.Scatter(x=df.index, y=data_to_plot, mode='lines', name=ticker_symbol))
-            else:
+            elif trace_data == 'no_close':
                 plot_info_messages.append(f"Fehler: 'Close'-Spalte nicht gefunden für {ticker_symbol}.")
-        if not fig.data:
-            fig.update_layout(title='Keine Daten zum Plotten verfügbar', xaxis_title='Datum', yaxis_title=y_axis_label)
-            return fig, html.Div(plot_info_messages)
-        fig.update_layout(
-            title=plot_title,
-            xaxis_title='Datum',
-            yaxis_title=y_axis_label,
-            hovermode="x unified",
-            template='plotly_white',
-            xaxis_rangeslider_visible=True
-        )
+            else:
+                series.append(trace_data)
+        chart_data = {
+            'tickers': selected_tickers,
+            'version': stock_manager.version,
+            'prices': {'layout': PRICE_PLOT_LAYOUT, 'series': series},
+            # Finanzcharts zeigen den ersten gewählten Ticker
+            'financial': _fin(selected_tickers[0], stock_manager.get_ticker_version(selected_tickers[0]))
+        }
+        if not series:
+            return chart_data, html.Div(plot_info_messages)
         status_text = html.Div([
             html.P(f"Plot zeigt Daten für: {', '.join([t for t in selected_tickers if t in stock_manager.historical_data and not stock_manager.historical_data[t].empty])}"),
             html.P("Hinweise: " + "; ".join(plot_info_messages), style={'color': 'orange', 'fontWeight': 'bold'}) if plot_info_messages else ""
         ])
-        return fig, status_text
+        return chart_data, status_text
+
+    # Relative Veränderung (Basis 100) wird im Browser gerechnet: Umschalten der
+    # Checkbox braucht keinen Server-Roundtrip
+    app.clientside_callback(
+        """
+        function(relativeValues, chartData) {
+            var rawCloses = chartData && chartData.prices;
+            if (!rawCloses) {
+                return {data: [], layout: {}};
+            }
+            var relative = (relativeValues || []).indexOf('relative_change') !== -1;
+            var traces = [];
+            rawCloses.series.forEach(function(s) {
+                var y = s.y;
+                if (relative) {
+                    var first = y[0];
+                    if (!first) {
+                        return;
+                    }
+                    // Ein Faktor, ein Durchlauf in einen typisierten Puffer
+                    var scale = 100 / first;
+                    var scaled = new Float64Array(y.length);
+                    for (var i = 0; i < y.length; i++) {
+                        scaled[i] = y[i] * scale;
+                    }
+                    y = scaled;
+                }
+                traces.push({type: 'scattergl', mode: 'lines', name: s.name, x: s.x, y: y});
+            });
+            var yLabel = relative ? 'Relative Veränderung (Index 100)' : 'Schlusskurs ($)';
+            var title = relative ? 'Relative Veränderung der Schlusskurse (Basis = 100)' : 'Historische Schlusskurse';
+            if (!traces.length) {
+                title = 'Keine Daten zum Plotten verfügbar';
+            }
+            var layout = Object.assign({}, rawCloses.layout, {
+                title: {text: title},
+                yaxis: Object.assign({}, rawCloses.layout.yaxis, {title: {text: yLabel}})
+            });
+            return {data: traces, layout: layout};
+        }
+        """,
+        Output('stock-price-plot', 'figure'),
+        Input('relative-change-checkbox', 'value'),
+        Input('chart-data', 'data')
+    )
 
-    @app.callback(
+    app.clientside_callback(
+        _bar_chart_js('fcf', 'Free Cash Flow', 'skyblue', 'Free Cash Flow für ', 'FCF (in Mio. $)'),
         Output('fcf-bar-chart', 'figure'),
+        Input('chart-data', 'data')
+    )
+    app.clientside_callback(
+        _bar_chart_js('debt', 'Total Debt', 'lightcoral', 'Gesamtverschuldung für ', 'Schuld (in Mio. $)'),
         Output('debt-bar-chart', 'figure'),
+        Input('chart-data', 'data')
+    )
+    app.clientside_callback(
+        """
+        function(chartData) {
+            var store = chartData && chartData.financial;
+            if (!store) {
+                return {data: [], layout: {title: {text: 'Wählen Sie einen Ticker für Finanzdaten aus.'}}};
+            }
+            if (!store.available) {
+                return {data: [], layout: {title: {text: 'Keine Finanzdaten für ' + store.ticker + ' verfügbar'}}};
+            }
+            var s = store.revenue;
+            if (!s) {
+                return {data: [], layout: {title: {text: 'Umsatz, Gewinn & Nettomarge für ' + store.ticker + ' nicht verfügbar'}}};
+            }
+            var data = [
+                {type: 'bar', x: s.revenue.x, y: s.revenue.y, name: 'Umsatz', yaxis: 'y', marker: {color: 'mediumseagreen'}},
+                {type: 'bar', x: s.net_income.x, y: s.net_income.y, name: 'Gewinn', yaxis: 'y', marker: {color: 'darkorange'}},
+                {type: 'scatter', x: s.net_margin.x, y: s.net_margin.y, mode: 'lines+markers', name: 'Nettomarge (%)',
+                 yaxis: 'y2', line: {color: 'red', width: 3}, marker: {size: 8}}
+            ];
+            var layout = Object.assign({}, store.layout, {
+                title: {text: 'Umsatz, Gewinn & Nettomarge für ' + store.ticker},
+                xaxis: {title: {text: 'Jahr'}, type: 'category'},
+                yaxis: {title: {text: 'Umsatz/Gewinn (in Mio. $)'}, tickformat: '.2s', hoverformat: '.2s', side: 'left'},
+                yaxis2: {title: {text: 'Nettomarge (%)'}, overlaying: 'y', side: 'right', tickformat: '.1f', showgrid: false},
+                barmode: 'group',
+                legend: {x: 0.01, y: 0.99, bgcolor: 'rgba(255,255,255,0.8)', bordercolor: 'rgba(0,0,0,0.2)', borderwidth: 1}
+            });
+            return {data: data, layout: layout};
+        }
+        """,
         Output('revenue-profit-margin-chart', 'figure'),
-        Input('ticker-dropdown', 'value')
+        Input('chart-data', 'data')
     )
-    def update_financial_charts(selected_tickers):
-        if not selected_tickers:
-            empty_fig = go.Figure()
-            empty_fig.update_layout(title="Wählen Sie einen Ticker für Finanzdaten aus.")
-            return empty_fig, empty_fig, empty_fig
-        ticker_symbol = selected_tickers[0] if isinstance(selected_tickers, list) else selected_tickers
-        financial_data = stock_manager.get_financial_data_for_ticker(ticker_symbol)
-        fcf_fig = go.Figure()
-        debt_fig = go.Figure()
-        revenue_profit_margin_fig = go.Figure()
-        if not financial_data:
-            fcf_fig.update_layout(title=f"Keine Finanzdaten für {ticker_symbol} verfügbar")
-            debt_fig.update_layout(title=f"Keine Finanzdaten für {ticker_symbol} verfügbar")
-            revenue_profit_margin_fig.update_layout(title=f"Keine Finanzdaten für {ticker_symbol} verfügbar")
-            return fcf_fig, debt_fig, revenue_profit_margin_fig
-        cashflow_df = financial_data.get('cashflow')
-        if cashflow_df is not None and 'Free Cash Flow' in cashflow_df.index:
-            fcf_series = cashflow_df.loc['Free Cash Flow'].dropna().sort_index()
-            fcf_fig = go.Figure(data=[go.Bar(x=fcf_series.index, y=fcf_series.values, name='Free Cash Flow', marker_color='skyblue')])
-            fcf_fig.update_layout(
-                title_text=f'Free Cash Flow für {ticker_symbol}',
-                xaxis_title='Jahr',
-                yaxis_title='FCF (in Mio. $)',
-                template='plotly_white',
-                margin=dict(l=20, r=20, t=40, b=20),
-                yaxis=dict(tickformat=".2s", hoverformat=".2s")
-            )
-        else:
-            fcf_fig.update_layout(title=f"Free Cash Flow für {ticker_symbol} nicht verfügbar")
-        balance_sheet_df = financial_data.get('balance_sheet')
-        if balance_sheet_df is not None and 'Total Debt' in balance_sheet_df.index:
-            debt_series = balance_sheet_df.loc['Total Debt'].dropna().sort_index()
-            debt_fig = go.Figure(data=[go.Bar(x=debt_series.index, y=debt_series.values, name='Total Debt', marker_color='lightcoral')])
-            debt_fig.update_layout(
-                title_text=f'Gesamtverschuldung für {ticker_symbol}',
-                xaxis_title='Jahr',
-                yaxis_title='Schuld (in Mio. $)',
-                template='plotly_white',
-                margin=dict(l=20, r=20, t=40, b=20),
-                yaxis=dict(tickformat=".2s", hoverformat=".2s")
-            )
-        else:
-            debt_fig.update_layout(title=f"Gesamtverschuldung für {ticker_symbol} nicht verfügbar")
-        financials_df = financial_data.get('financials')
-        if financials_df is not None and 'Total Revenue' in financials_df.index and 'Net Income' in financials_df.index:
-            revenue_series = financials_df.loc['Total Revenue'].dropna().sort_index()
-            net_income_series = financials_df.loc['Net Income'].dropna().sort_index()
-            net_margin_series = (net_income_series / revenue_series * 100).fillna(0)
-            revenue_profit_margin_fig = go.Figure()
-            revenue_profit_margin_fig.add_trace(go.Bar(x=revenue_series.index, y=revenue_series.values, name='Umsatz', yaxis='y1', marker_color='mediumseagreen'))
-            revenue_profit_margin_fig.add_trace(go.Bar(x=net_income_series.index, y=net_income_series.values, name='Gewinn', yaxis='y1', marker_color='darkorange'))
-            revenue_profit_margin_fig.add_trace(go.Scatter(
-                x=net_margin_series.index,
-                y=net_margin_series.values,
-                mode='lines+markers',
-                name='Nettomarge (%)',
-                yaxis='y2',
-                line=dict(color='red', width=3),
-                marker=dict(size=8)
-            ))
-            revenue_profit_margin_fig.update_layout(
-                title_text=f'Umsatz, Gewinn & Nettomarge für {ticker_symbol}',
-                xaxis_title='Jahr',
-                yaxis=dict(title='Umsatz/Gewinn (in Mio. $)', tickformat=".2s", hoverformat=".2s", side='left'),
-                yaxis2=dict(title='Nettomarge (%)', overlaying='y', side='right', tickformat=".1f", showgrid=False),
-                barmode='group',
-                template='plotly_white',
-                legend=dict(x=0.01, y=0.99, bgcolor='rgba(255,255,255,0.8)', bordercolor='rgba(0,0,0,0.2)', borderwidth=1),
-                margin=dict(l=20, r=20, t=40, b=20)
-            )
-        else:
-            revenue_profit_margin_fig.update_layout(title=f"Umsatz, Gewinn & Nettomarge für {ticker_symbol} nicht verfügbar")
-        return fcf_fig, debt_fig, revenue_profit_margin_fig
 
     @app.callback(
         Output('vix-chart', 'figure'),
@@ -202,50 +474,72 @@ def register_callbacks(app, stock_manager):
         total_days = yearframe_duration * 365
         macro_end_date = datetime.now()
         macro_start_date = macro_end_date - timedelta(days=total_days)
-        vix_fig = go.Figure()
+        # Figuren als einfache Dicts: Dash serialisiert sie direkt, ohne go.Figure-Validierung
         try:
-            vix_data_to_plot = fetch_vix_data(macro_start_date, macro_end_date)
+            vix_data_to_plot = _cached_macro(fetch_vix_data, macro_start_date, macro_end_date)
             if not vix_data_to_plot.empty:
-                vix_fig = go.Figure(data=[go.Scatter(x=vix_data_to_plot.index, y=vix_data_to_plot.values, mode='lines', name='VIX')])
-                vix_fig.update_layout(
-                    title_text='VIX (CBOE Volatilitätsindex) - Marktstimmung',
-                    xaxis_title='Datum',
-                    yaxis_title='VIX Wert',
-                    template='plotly_white',
-                    margin=dict(l=20, r=20, t=40, b=20),
-                    xaxis=dict(tickformat='%Y-%m-%d', hoverformat='%Y-%m-%d %H:%M:%S')
-                )
+                vix_fig = {
+                    'data': [{'type': 'scattergl', 'mode': 'lines', 'name': 'VIX',
+                              'x': vix_data_to_plot.index.to_numpy(), 'y': vix_data_to_plot.to_numpy()}],
+                    'layout': {
+                        **BASE_CHART_LAYOUT,
+                        'title': {'text': 'VIX (CBOE Volatilitätsindex) - Marktstimmung'},
+                        'xaxis': {'title': {'text': 'Datum'}, 'tickformat': '%Y-%m-%d', 'hoverformat': '%Y-%m-%d %H:%M:%S'},
+                        'yaxis': {'title': {'text': 'VIX Wert'}}
+                    }
+                }
             else:
-                vix_fig.update_layout(title="VIX Daten nicht verfügbar")
+                vix_fig = _titled_figure("VIX Daten nicht verfügbar")
         except Exception as e:
-            vix_fig.update_layout(title=f"Fehler beim Laden der VIX Daten: {e}")
-        yield_curve_fig = go.Figure()
+            vix_fig = _titled_figure(f"Fehler beim Laden der VIX Daten: {e}")
         try:
-            yield_data = fetch_yield_curve_data(macro_start_date, macro_end_date, FRED_API_KEY)
+            yield_data = _cached_macro(fetch_yield_curve_data, macro_start_date, macro_end_date, FRED_API_KEY)
             if not yield_data.empty:
-                yield_curve_fig.add_trace(go.Scatter(x=yield_data.index, y=yield_data['DGS10'], mode='lines', name='10-jährig (FRED DGS10)'))
-                yield_curve_fig.add_trace(go.Scatter(x=yield_data.index, y=yield_data['DGS2'], mode='lines', name='2-jährig (FRED DGS2)'))
-                yield_curve_fig.add_trace(go.Scatter(x=yield_data.index, y=yield_data['Spread'], mode='lines', name='Spread (10Y - 2Y)', line=dict(dash='dot', color='grey')))
-                yield_curve_fig.update_layout(
-                    title_text='US Staatsanleihen-Renditen (2- vs. 10-jährig)',
-                    xaxis_title='Datum',
-                    yaxis_title='Rendite (%)',
-                    template='plotly_white',
-                    margin=dict(l=20, r=20, t=40, b=20)
-                )
+                # datetime64-Array statt DatetimeIndex: deutlich schneller serialisiert
+                x = yield_data.index.to_numpy()
+                yield_curve_fig = {
+                    'data': [
+                        {'type': 'scattergl', 'mode': 'lines', 'name': '10-jährig (FRED DGS10)', 'x': x, 'y': yield_data['DGS10'].to_numpy()},
+                        {'type': 'scattergl', 'mode': 'lines', 'name': '2-jährig (FRED DGS2)', 'x': x, 'y': yield_data['DGS2'].to_numpy()},
+                        {'type': 'scattergl', 'mode': 'lines', 'name': 'Spread (10Y - 2Y)', 'x': x, 'y': yield_data['Spread'].to_numpy(),
+                         'line': {'dash': 'dot', 'color': 'grey'}}
+                    ],
+                    'layout': {
+                        **BASE_CHART_LAYOUT,
+                        'title': {'text': 'US Staatsanleihen-Renditen (2- vs. 10-jährig)'},
+                        'xaxis': {'title': {'text': 'Datum'}},
+                        'yaxis': {'title': {'text': 'Rendite (%)'}}
+                    }
+                }
             else:
-                yield_curve_fig.update_layout(title="US Staatsanleihen-Renditen Daten nicht verfügbar")
+                yield_curve_fig = _titled_figure("US Staatsanleihen-Renditen Daten nicht verfügbar")
         except Exception as e:
-            yield_curve_fig.update_layout(title=f"Fehler beim Laden der Renditen Daten: {e}")
+            yield_curve_fig = _titled_figure(f"Fehler beim Laden der Renditen Daten: {e}")
         return vix_fig, yield_curve_fig
 
     # ============== TSM CALLBACKS ==============
 
+    @lru_cache(maxsize=32)
+    def _tsm_run(ticker_symbol, version, params_key):
+        """
+        Run the TSM pipeline on a ticker's closes: (signals_df, returns_df, metrics).
+
+        params_key is dataclasses.astuple(TSMParameters). Shared by the analysis
+        and the scenario callback, so saving the scenario on screen reuses the
+        result. As with _close_trace, version (the ticker's data state) retires
+        entries after a refetch. Callers check for missing prices first; the
+        returned frames must not be modified.
+        """
+        tsm = TimeSeriesMomentum(TSMParameters(*params_key))
+        signals_df = tsm.calculate_signals(stock_manager.get_price_series(ticker_symbol, 'Close'))
+        returns_df = tsm.calculate_strategy_returns(signals_df)
+        return signals_df, returns_df, tsm.calculate_performance_metrics(returns_df)
+
     @app.callback(
         Output('tsm-signal-chart', 'figure'),
         Output('tsm-returns-chart', 'figure'),
         Output('tsm-metrics-container', 'children'),
-        Input('ticker-dropdown', 'value'),
+        Input('ticker-debounced', 'data'),
         Input('tsm-lookback-slider', 'value'),
         Input('tsm-holding-dropdown', 'value'),
         Input('tsm-vol-scaling-check', 'value'),
@@ -295,81 +589,75 @@ def register_callbacks(app, stock_manager):
 
         # Run TSM calculation
         try:
-            tsm = TimeSeriesMomentum(params)
-            signals_df = tsm.calculate_signals(prices)
-            returns_df = tsm.calculate_strategy_returns(signals_df)
-            metrics = tsm.calculate_performance_metrics(returns_df)
+            signals_df, returns_df, metrics = _tsm_run(
+                ticker, stock_manager.get_ticker_version(ticker), astuple(params)
+            )
         except Exception as e:
             signal_fig.update_layout(title=f"Fehler: {str(e)}")
             returns_fig.update_layout(title=f"Fehler: {str(e)}")
             return signal_fig, returns_fig, html.P(f"Fehler: {str(e)}", style={'color': 'red'})
 
+        # Downsample the lines to screen resolution with LTTB; the drawdown
+        # reuses the strategy points, whose peaks and troughs it mirrors
+        dates = signals_df.index
+        if getattr(dates, 'tz', None) is not None:
+            dates = dates.tz_localize(None)
+        dates = dates.to_numpy()
+        return_dates = dates if returns_df.index.equals(signals_df.index) else returns_df.index.to_numpy()
+        close = signals_df['close'].to_numpy()
+        cum_strategy = returns_df['cumulative_strategy'].to_numpy()
+        cum_benchmark = returns_df['cumulative_benchmark'].to_numpy()
+        price_keep = lttb_indices(close)
+        strategy_keep = lttb_indices(cum_strategy)
+        benchmark_keep = lttb_indices(cum_benchmark)
+
         # Build Signal Chart
         signal_fig = go.Figure()
 
         # Add price line
-        signal_fig.add_trace(go.Scatter(
-            x=signals_df.index,
-            y=signals_df['close'],
+        signal_fig.add_trace(go.Scattergl(
+            x=dates[price_keep],
+            y=close[price_keep],
             mode='lines',
             name='Preis',
             line=dict(color='#333', width=1.5)
         ))
 
-        # Add colored background for signals
-        signal_colors = signals_df['signal'].fillna(0)
-        for i in range(1, len(signals_df)):
-            if signal_colors.iloc[i] > 0:
-                color = 'rgba(0, 200, 0, 0.15)'  # Green for long
-            elif signal_colors.iloc[i] < 0:
-                color = 'rgba(200, 0, 0, 0.15)'  # Red for short
-            else:
-                continue
-
-            signal_fig.add_vrect(
-                x0=signals_df.index[i-1],
-                x1=signals_df.index[i],
-                fillcolor=color,
-                layer="below",
-                line_width=0
-            )
+        # Add colored background for signals: one rectangle per run of equal signals
+        signal_fig.update_layout(shapes=_signal_shapes(signals_df.index, signals_df['signal'].to_numpy()))
 
         signal_fig.update_layout(
             title=f'Momentum Signal für {ticker} (Lookback: {lookback_months}M)',
             xaxis_title='Datum',
             yaxis_title='Preis ($)',
-            template='plotly_white',
-            hovermode='x unified',
-            showlegend=True,
-            legend=dict(x=0.01, y=0.99),
-            margin=dict(l=20, r=20, t=40, b=20)
+            **TSM_CHART_LAYOUT
         )
 
         # Build Returns Chart
         returns_fig = go.Figure()
 
         # Strategy cumulative returns
-        returns_fig.add_trace(go.Scatter(
-            x=returns_df.index,
-            y=returns_df['cumulative_strategy'],
+        returns_fig.add_trace(go.Scattergl(
+            x=return_dates[strategy_keep],
+            y=cum_strategy[strategy_keep],
             mode='lines',
             name='TSM Strategie',
             line=dict(color='#2196F3', width=2)
         ))
 
         # Benchmark cumulative returns
-        returns_fig.add_trace(go.Scatter(
-            x=returns_df.index,
-            y=returns_df['cumulative_benchmark'],
+        returns_fig.add_trace(go.Scattergl(
+            x=return_dates[benchmark_keep],
+            y=cum_benchmark[benchmark_keep],
             mode='lines',
             name='Buy & Hold',
             line=dict(color='#9E9E9E', width=2, dash='dash')
         ))
 
         # Drawdown area
-        returns_fig.add_trace(go.Scatter(
-            x=returns_df.index,
-            y=returns_df['drawdown'] * 100,
+        returns_fig.add_trace(go.Scattergl(
+            x=return_dates[strategy_keep],
+            y=returns_df['drawdown'].to_numpy()[strategy_keep] * 100,
             mode='lines',
             name='Drawdown (%)',
             fill='tozeroy',
@@ -383,12 +671,8 @@ def register_callbacks(app, stock_manager):
             xaxis_title='Datum',
             yaxis=dict(title='Wert (Basis 100)', side='left'),
             yaxis2=dict(title='Drawdown (%)', overlaying='y', side='right', range=[-50, 5]),
-            template='plotly_white',
-            hovermode='x unified',
-            showlegend=True,
-            legend=dict(x=0.01, y=0.99),
-            margin=dict(l=20, r=20, t=40, b=20),
-            xaxis_rangeslider_visible=True
+            xaxis_rangeselector=_RANGE_SELECTOR,
+            **TSM_CHART_LAYOUT
         )
 
         # Build Metrics Panel
@@ -411,15 +695,17 @@ def register_callbacks(app, stock_manager):
 
         return signal_fig, returns_fig, metrics_html
 
-    @app.callback(
+    # Show/hide the volatility target input in the browser, no server round trip
+    app.clientside_callback(
+        """
+        function(volScalingEnabled) {
+            var enabled = (volScalingEnabled || []).indexOf('enabled') !== -1;
+            return {marginTop: '5px', display: enabled ? 'block' : 'none'};
+        }
+        """,
         Output('tsm-vol-target-container', 'style'),
         Input('tsm-vol-scaling-check', 'value')
     )
-    def toggle_volatility_target_visibility(vol_scaling_enabled):
-        """Show/hide volatility target input based on checkbox."""
-        if 'enabled' in (vol_scaling_enabled or []):
-            return {'marginTop': '5px', 'display': 'block'}
-        return {'marginTop': '5px', 'display': 'none'}
 
     @app.callback(
         Output('tsm-scenarios-store', 'data'),
@@ -490,10 +776,7 @@ def register_callbacks(app, stock_manager):
             )
 
             try:
-                tsm = TimeSeriesMomentum(params)
-                signals = tsm.calculate_signals(prices)
-                returns = tsm.calculate_strategy_returns(signals)
-                metrics = tsm.calculate_performance_metrics(returns)
+                _, _, metrics = _tsm_run(ticker, stock_manager.get_ticker_version(ticker), astuple(params))
 
                 # Store scenario results
                 current_scenarios[scenario_name] = {
@@ -8,10 +8,42 @@ from visualization.components.tsm_components import create_tsm_dashboard_section
 from visualization.components.rsi_components import create_rsi_backtest_section
 from portfolio.components import create_portfolio_layout
 
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+except ImportError:  # orjson ist optional, ohne bleibt Flasks Standard-Encoder
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:  # flask-compress ist optional, ohne werden Antworten unkomprimiert gesendet
+    Compress = None
+
+if orjson is not None:
+    class ORJSONProvider(JSONProvider):
+        """Flask-JSON über orjson; NumPy-Arrays werden direkt serialisiert."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+# Zeiträume der Makro-Charts; statisch, daher einmal beim Import aufgebaut.
+# Als Tupel, damit keine Layout-Instanz die gemeinsame Liste verändern kann
+_YEARFRAME_OPTIONS = (
+    {"label": "1 Month", "value": 1/12},
+    {"label": "1 Year", "value": 1},
+    {"label": "2 Years", "value": 2},
+    {"label": "5 Years", "value": 5},
+    {"label": "10 Years", "value": 10},
+)
 
 def create_stock_analysis_layout():
     """Erstellt das Layout für den Aktienanalyse-Tab."""
     return html.Div([
+        # Kurs- und Finanzdaten der Auswahl, aus denen der Browser die Charts baut
+        dcc.Store(id='chart-data'),
         html.Div([
             html.Label('Füge Ticker für Datenabfrage hinzu', style={'fontSize': '1.2em', 'fontWeight': 'bold'}),
             dcc.Input(id='new-ticker-input', type='text', placeholder="Ticker Symbol(e) eingeben (kommagetrennt)", style={'width': '60%', 'marginRight': '10px', 'padding': '8px'}),
@@ -20,6 +52,7 @@ def create_stock_analysis_layout():
             html.Hr(style={'marginTop': '20px', 'marginBottom': '20px'}),
             html.Label("Wähle(n) Sie Ticker aus:", style={'fontSize': '1.2em', 'fontWeight': 'bold'}),
             dcc.Dropdown(id='ticker-dropdown', options=[], multi=True, placeholder="Wählen Sie einen oder mehrere Ticker aus", style={'width': '80%', 'margin': '10px auto'}),
+            dcc.Store(id='ticker-debounced'),
             html.Div([
                 dcc.Checklist(id='relative-change-checkbox', options=[{'label': 'Relative Veränderung anzeigen', 'value': 'relative_change'}], value=[]),
             ], style={'display': 'flex', 'alignItems': 'center', 'justifyContent': 'center', 'marginTop': '15px'}),
@@ -42,12 +75,7 @@ def create_stock_analysis_layout():
             html.Div([
                 dcc.Dropdown(
                     id='yearframe-dropdown',
-                    options=[
-                        {"label": "1 Month", "value": 1/12},
-                        {"label": "1 Year", "value": 1},
-                        {"label": "2 Years", "value": 2},
-                        {"label": "5 Years", "value": 5},
-                        {"label": "10 Years", "value": 10}],
+                    options=list(_YEARFRAME_OPTIONS),
                     clearable=False,
                     value=5,
                     style={'width': '80%', 'margin': '10px auto'}
@@ -75,6 +103,15 @@ def create_stock_analysis_layout():
 
 def create_app():
     app = Dash(__name__, suppress_callback_exceptions=True)
+    # Callback-Antworten serialisiert Plotly bereits mit orjson, sobald es
+    # installiert ist; hier folgen die übrigen Flask-JSON-Antworten
+    if orjson is not None:
+        app.server.json = ORJSONProvider(app.server)
+    # Figuren-JSON (Kurs-, Makro-Reihen) lässt sich stark komprimieren
+    if Compress is not None:
+        app.server.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html', 'text/css', 'application/javascript']
+        app.server.config['COMPRESS_LEVEL'] = 6
+        Compress(app.server)
 
     # Tab-Styling
     TAB_STYLE = {
@@ -0,0 +1,63 @@
+# visualization/downsampling.py
+"""
+Downsampling langer Zeitreihen für Plotly-Charts.
+
+Largest-Triangle-Three-Buckets (LTTB) behält die visuell relevanten Punkte
+(Spitzen, Täler) und reduziert die Punktzahl auf etwa die Bildschirmbreite.
+"""
+
+import numpy as np
+
+# Mehr Punkte als Pixel in der Breite bringen im Chart nichts
+MAX_CHART_POINTS = 2000
+
+
+def lttb_indices(y, n_out: int = MAX_CHART_POINTS) -> np.ndarray:
+    """
+    Wählt per LTTB die Positionen der Punkte, die gezeichnet werden sollen.
+
+    Die x-Achse wird als gleichmäßig (Handelstage) angenommen. Die Indizes
+    können auf mehrere Reihen mit gleichem Index angewendet werden, damit
+    z.B. Preis und Bänder deckungsgleich bleiben.
+
+    Args:
+        y: Werte der führenden Reihe
+        n_out: Gewünschte Anzahl Punkte
+
+    Returns:
+        Sortiertes Integer-Array mit Positionen (alle, wenn n_out >= len(y))
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.arange(n, dtype=float)
+    # n_out - 2 Buckets zwischen erstem und letztem Punkt
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    selected = 0
+    for i in range(n_out - 2):
+        start = edges[i]
+        end = max(edges[i + 1], start + 1)
+        next_start = end
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_end = max(next_end, next_start + 1)
+
+        # Durchschnittspunkt des nächsten Buckets
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        # Dreiecksfläche aus gewähltem Punkt, Kandidat und Durchschnittspunkt
+        ax, ay = x[selected], y[selected]
+        area = np.abs((ax - avg_x) * (y[start:end] - ay) - (ax - x[start:end]) * (avg_y - ay))
+        area = np.where(np.isnan(area), -1.0, area)
+
+        selected = start + int(np.argmax(area))
+        indices[i + 1] = selected
+
+    return indices
@@ -4,11 +4,14 @@ Dash Callbacks für RSI Mean-Reversion Backtest.
 """
 
 import os
+from dataclasses import astuple
 from datetime import datetime
+from functools import lru_cache
 from dash import html, no_update, callback_context
 from dash.dependencies import Input, Output, State
 import plotly.graph_objs as go
 from plotly.subplots import make_subplots
+import numpy as np
 import pandas as pd
 
 from calculations.rsi_mean_reversion import (
@@ -17,6 +20,7 @@ from calculations.rsi_mean_reversion import (
     RSIParameterOptimizer
 )
 from visualization.components.rsi_components import create_rsi_metric_card
+from visualization.downsampling import lttb_indices
 
 
 def parse_comma_list(text: str, dtype=float) -> list:
@@ -105,6 +109,27 @@ def parse_comma_list(text: str, dtype=float) -> list:
 def register_rsi_callbacks(app, stock_manager):
     """Registriert alle RSI-Backtest Callbacks."""
 
+    @lru_cache(maxsize=16)
+    def _run_backtest(ticker_symbol, version, params_key):
+        """
+        Führt den RSI-Backtest auf den Schlusskursen eines Tickers aus.
+
+        params_key ist dataclasses.astuple(RSIMeanReversionParameters). Wie bei
+        _tsm_run macht version (stock_manager.get_ticker_version) Einträge nach
+        einem neuen Abruf ungültig, auch wenn sich nur frühere Kurse geändert
+        haben (Dividenden-/Split-Anpassung). Die Ergebnisse dürfen nicht
+        verändert werden.
+
+        Returns:
+            (signals, trades, returns, metrics)
+        """
+        strategy = RSIMeanReversion(RSIMeanReversionParameters(*params_key))
+        signals = strategy.calculate_signals(stock_manager.get_price_series(ticker_symbol, 'Close'))
+        trades = strategy.simulate_trades(signals)
+        returns = strategy.calculate_returns(signals)
+        metrics = strategy.calculate_metrics()
+        return signals, trades, returns, metrics
+
     # =========================================================================
     # Callback: Einzelner Backtest
     # =========================================================================
@@ -165,18 +190,42 @@ def register_rsi_callbacks(app, stock_manager):
         )
 
         try:
-            # Strategie ausführen
-            strategy = RSIMeanReversion(params)
-            signals = strategy.calculate_signals(prices)
-            trades = strategy.simulate_trades(signals)
-            returns = strategy.calculate_returns(signals)
-            metrics = strategy.calculate_metrics()
+            # Strategie ausführen (wiederholte Klicks mit gleichen Eingaben aus dem Cache)
+            signals, trades, returns, metrics = _run_backtest(
+                ticker, stock_manager.get_ticker_version(ticker), astuple(params)
+            )
 
         except Exception as e:
             signal_fig.update_layout(title=f"Fehler: {str(e)}")
             returns_fig.update_layout(title=f"Fehler: {str(e)}")
             return signal_fig, returns_fig, html.P(f"Fehler: {str(e)}", style={'color': 'red'})
 
+        # Chart-Spalten als float32: für die Darstellung reicht die Genauigkeit,
+        # und die JSON-Nutzlast an den Browser halbiert sich
+        price_close, price_ma, price_upper, price_lower, rsi_values = signals[
+            ['close', 'ma', 'upper_band', 'lower_band', 'rsi']
+        ].to_numpy(dtype=np.float32).T
+        cum_strategy, cum_benchmark, drawdown_pct = (
+            returns[['cumulative_strategy', 'cumulative_benchmark', 'drawdown']].to_numpy(dtype=np.float32)
+            * np.array([1, 1, 100], dtype=np.float32)
+        ).T
+
+        # x-Achse einmal als datetime64-Array (Wandzeit, ohne Zeitzone), damit
+        # Plotly keine Timestamp-Objekte einzeln prüfen muss
+        dates = signals.index
+        if getattr(dates, 'tz', None) is not None:
+            dates = dates.tz_localize(None)
+        signal_dates = dates.to_numpy()
+        return_dates = signal_dates if returns.index.equals(signals.index) else returns.index.to_numpy()
+
+        # Linien per LTTB auf Bildschirmauflösung reduzieren; Preis und Bänder
+        # teilen sich die Punkte, damit die Füllung zwischen den Bändern passt.
+        # Trade-Marker bleiben in voller Auflösung.
+        price_keep = lttb_indices(price_close)
+        rsi_keep = lttb_indices(rsi_values)
+        equity_keep = lttb_indices(cum_strategy)
+        benchmark_keep = lttb_indices(cum_benchmark)
+
         # =====================================================================
         # Signal Chart mit Subplots
         # =====================================================================
@@ -190,8 +239,8 @@ def register_rsi_callbacks(app, stock_manager):
 
         # Preis
         signal_fig.add_trace(
-            go.Scatter(
-                x=signals.index, y=signals['close'],
+            go.Scattergl(
+                x=signal_dates[price_keep], y=price_close[price_keep],
                 mode='lines', name='Preis',
                 line=dict(color='#333', width=1.5)
             ),
@@ -200,8 +249,8 @@ def register_rsi_callbacks(app, stock_manager):
 
         # Moving Average
         signal_fig.add_trace(
-            go.Scatter(
-                x=signals.index, y=signals['ma'],
+            go.Scattergl(
+                x=signal_dates[price_keep], y=price_ma[price_keep],
                 mode='lines', name=f'MA({params.ma_period})',
                 line=dict(color='#2196F3', width=1, dash='dash')
             ),
@@ -210,8 +259,8 @@ def register_rsi_callbacks(app, stock_manager):
 
         # Bollinger Bands
         signal_fig.add_trace(
-            go.Scatter(
-                x=signals.index, y=signals['upper_band'],
+            go.Scattergl(
+                x=signal_dates[price_keep], y=price_upper[price_keep],
                 mode='lines', name='Upper Band',
                 line=dict(color='#FF9800', width=1),
                 showlegend=False
@@ -219,8 +268,8 @@ def register_rsi_callbacks(app, stock_manager):
             row=1, col=1
         )
         signal_fig.add_trace(
-            go.Scatter(
-                x=signals.index, y=signals['lower_band'],
+            go.Scattergl(
+                x=signal_dates[price_keep], y=price_lower[price_keep],
                 mode='lines', name='Lower Band',
                 line=dict(color='#FF9800', width=1),
                 fill='tonexty',
@@ -229,68 +278,45 @@ def register_rsi_callbacks(app, stock_manager):
             row=1, col=1
         )
 
-        # Trade Markers
+        # Trade Markers (Positionen per flatnonzero statt gefilterter Teil-DataFrames)
         if not trades.empty:
-            # Entry Points
-            long_entries = trades[trades['direction'] == 'Long']
-            short_entries = trades[trades['direction'] == 'Short']
-
-            if not long_entries.empty:
-                signal_fig.add_trace(
-                    go.Scatter(
-                        x=long_entries['entry_date'],
-                        y=long_entries['entry_price'],
-                        mode='markers',
-                        name='Long Entry',
-                        marker=dict(symbol='triangle-up', size=12, color='#4CAF50')
-                    ),
-                    row=1, col=1
-                )
-
-            if not short_entries.empty:
-                signal_fig.add_trace(
-                    go.Scatter(
-                        x=short_entries['entry_date'],
-                        y=short_entries['entry_price'],
-                        mode='markers',
-                        name='Short Entry',
-                        marker=dict(symbol='triangle-down', size=12, color='#f44336')
-                    ),
-                    row=1, col=1
-                )
-
-            # Exit Points (TP/SL)
-            tp_exits = trades[trades['exit_reason'] == 'Take Profit']
-            sl_exits = trades[trades['exit_reason'] == 'Stop Loss']
-
-            if not tp_exits.empty:
-                signal_fig.add_trace(
-                    go.Scatter(
-                        x=tp_exits['exit_date'],
-                        y=tp_exits['exit_price'],
-                        mode='markers',
-                        name='Take Profit',
-                        marker=dict(symbol='star', size=10, color='#4CAF50')
-                    ),
-                    row=1, col=1
-                )
-
-            if not sl_exits.empty:
-                signal_fig.add_trace(
-                    go.Scatter(
-                        x=sl_exits['exit_date'],
-                        y=sl_exits['exit_price'],
-                        mode='markers',
-                        name='Stop Loss',
-                        marker=dict(symbol='x', size=10, color='#f44336')
-                    ),
-                    row=1, col=1
-                )
+            directions = trades['direction'].to_numpy()
+            exit_reasons = trades['exit_reason'].to_numpy()
+            entry_dates = trades['entry_date'].to_numpy()
+            entry_prices = trades['entry_price'].to_numpy()
+            exit_dates = trades['exit_date'].to_numpy()
+            exit_prices = trades['exit_price'].to_numpy()
+
+            markers = [
+                # (Name, Positionen, x, y, Marker)
+                ('Long Entry', np.flatnonzero(directions == 'Long'), entry_dates, entry_prices,
+                 dict(symbol='triangle-up', size=12, color='#4CAF50')),
+                ('Short Entry', np.flatnonzero(directions == 'Short'), entry_dates, entry_prices,
+                 dict(symbol='triangle-down', size=12, color='#f44336')),
+                # Exit Points (TP/SL)
+                ('Take Profit', np.flatnonzero(exit_reasons == 'Take Profit'), exit_dates, exit_prices,
+                 dict(symbol='star', size=10, color='#4CAF50')),
+                ('Stop Loss', np.flatnonzero(exit_reasons == 'Stop Loss'), exit_dates, exit_prices,
+                 dict(symbol='x', size=10, color='#f44336')),
+            ]
+
+            for name, idx, x_values, y_values, marker in markers:
+                if idx.size:
+                    signal_fig.add_trace(
+                        go.Scatter(
+                            x=x_values[idx],
+                            y=y_values[idx],
+                            mode='markers',
+                            name=name,
+                            marker=marker
+                        ),
+                        row=1, col=1
+                    )
 
         # RSI
         signal_fig.add_trace(
-            go.Scatter(
-                x=signals.index, y=signals['rsi'],
+            go.Scattergl(
+                x=signal_dates[rsi_keep], y=rsi_values[rsi_keep],
                 mode='lines', name='RSI',
                 line=dict(color='#9C27B0', width=1.5)
             ),
@@ -319,20 +345,20 @@ def register_rsi_callbacks(app, stock_manager):
         # =====================================================================
         returns_fig = go.Figure()
 
-        returns_fig.add_trace(go.Scatter(
-            x=returns.index, y=returns['cumulative_strategy'],
+        returns_fig.add_trace(go.Scattergl(
+            x=return_dates[equity_keep], y=cum_strategy[equity_keep],
             mode='lines', name='Strategie',
             line=dict(color='#2196F3', width=2)
         ))
 
-        returns_fig.add_trace(go.Scatter(
-            x=returns.index, y=returns['cumulative_benchmark'],
+        returns_fig.add_trace(go.Scattergl(
+            x=return_dates[benchmark_keep], y=cum_benchmark[benchmark_keep],
             mode='lines', name='Buy & Hold',
             line=dict(color='#9E9E9E', width=2, dash='dash')
         ))
 
-        returns_fig.add_trace(go.Scatter(
-            x=returns.index, y=returns['drawdown'] * 100,
+        returns_fig.add_trace(go.Scattergl(
+            x=return_dates[equity_keep], y=drawdown_pct[equity_keep],
             mode='lines', name='Drawdown (%)',
             fill='tozeroy',
             fillcolor='rgba(255, 0, 0, 0.2)',